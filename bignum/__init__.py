@@ -0,0 +1,14 @@
+"""
+Arbitrary precision decimal arithmetic.
+
+The core module is imported first, whichever submodule is imported, so that the operation
+engines it wires into the operators always load in the same order.
+
+Examples:
+    >>> import subprocess, sys
+    >>> modules = ['operations.add', 'operations.subtract', 'operations.multiply', 'operations.division',
+    ...            'operations.power', 'operations.root', 'cache', 'context', 'batch', 'stream', 'tester']
+    >>> [module for module in modules if subprocess.run([sys.executable, '-c', f'import bignum.{module}']).returncode]
+    []
+"""
+from . import bignum
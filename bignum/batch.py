@@ -0,0 +1,244 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional. Without it, every pair goes through the scalar operation engines.
+    np = None
+
+from .bignum import bignum, _adder, _subtractor, _multiplier, _divider
+from .context import getcontext
+
+# Mantissas up to this many bits are handed to the vectorized kernels. Each kernel checks
+# that its intermediate values stay within a signed 64-bit integer.
+_WORD_BITS = 62
+_WORD_LIMIT = 1 << _WORD_BITS
+
+
+@dataclass
+class Column:
+    """
+    Columnar storage for many bignum values: parallel lists of signs, mantissas and scales.
+
+    Examples:
+        >>> column = Column.from_values(["1.5", "-2", 30])
+        >>> column.mantissa, column.scale
+        ([15, 2, 30], [1, 0, 0])
+        >>> column.to_list()
+        [bignum('1.5'), bignum('-2'), bignum('30')]
+    """
+    negative: list[bool] = field(default_factory=list)
+    mantissa: list[int] = field(default_factory=list)
+    scale: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_values(cls, values: Iterable) -> Column:
+        """Build a column from bignum instances or anything the bignum constructor accepts."""
+        if isinstance(values, Column):
+            return values
+        column = cls()
+        for value in values:
+            negative, mantissa, scale = (value if isinstance(value, bignum) else bignum(value))._parts()
+            column.append(negative, mantissa, scale)
+        return column
+
+    def append(self, negative: bool, mantissa: int, scale: int):
+        self.negative.append(negative)
+        self.mantissa.append(mantissa)
+        self.scale.append(scale)
+
+    def __len__(self) -> int:
+        return len(self.mantissa)
+
+    def __getitem__(self, idx: int) -> bignum:
+        return bignum._from_parts(self.negative[idx], self.mantissa[idx], self.scale[idx])
+
+    def __iter__(self) -> Iterator[bignum]:
+        return (self[idx] for idx in range(len(self)))
+
+    def to_list(self) -> list[bignum]:
+        return list(self)
+
+
+def _apply(xs: Iterable, ys: Iterable, kernel: Optional[Callable], scalar: Callable[[bignum, bignum], bignum]) -> Column:
+    """
+    Apply an operation to every pair of values.
+
+    Pairs that the vectorized kernel can handle are computed with NumPy; the rest are
+    passed one by one to `scalar`. Both paths give the same, filtered results.
+
+    Examples:
+        >>> xs, ys = ["1.5", "0.5", "-2.50", "7"], ["2.5", "0.2", "0.5", "-7"]
+        >>> scalar = _apply(xs, ys, None, _multiplier.multiply_two_nums)
+        >>> [str(num) for num in _apply(xs, ys, _multiply_kernel, _multiplier.multiply_two_nums)] == [str(num) for num in scalar]
+        True
+    """
+    column1, column2 = Column.from_values(xs), Column.from_values(ys)
+    if len(column1) != len(column2):
+        raise ValueError("Operand columns must have the same length")
+    size = len(column1)
+    result = Column([False] * size, [0] * size, [0] * size)
+
+    pending = range(size)
+    # The kernels compute exact results, so they are skipped when the context rounds them.
+    if np is not None and kernel is not None and size and getcontext().precision is None:
+        pending = _apply_vectorized(column1, column2, kernel, result)
+
+    for idx in pending:
+        negative, mantissa, scale = scalar(column1[idx], column2[idx])._parts()
+        result.negative[idx], result.mantissa[idx], result.scale[idx] = negative, mantissa, scale
+    return result
+
+
+def _apply_vectorized(column1: Column, column2: Column, kernel: Callable, result: Column) -> list[int]:
+    """
+    Run `kernel` over the pairs whose mantissas fit in a machine word and write them into `result`.
+
+    Returns:
+        list[int]: The indices of the pairs that are left for the scalar engines.
+    """
+    candidates = [idx for idx, (mantissa1, mantissa2) in enumerate(zip(column1.mantissa, column2.mantissa))
+                  if mantissa1.bit_length() <= _WORD_BITS and mantissa2.bit_length() <= _WORD_BITS]
+    if not candidates:
+        return list(range(len(column1)))
+
+    def signed(column: Column) -> Tuple:
+        mantissa = np.array([-column.mantissa[idx] if column.negative[idx] else column.mantissa[idx] for idx in candidates], dtype=np.int64)
+        scale = np.array([column.scale[idx] for idx in candidates], dtype=np.int64)
+        return mantissa, scale
+
+    mantissa, scale, ok = kernel(*signed(column1), *signed(column2))
+    mantissa, scale = _normalized(mantissa, scale)
+    done = np.array(candidates, dtype=np.intp)[ok].tolist()
+    for idx, value, value_scale in zip(done, mantissa[ok].tolist(), scale[ok].tolist()):
+        result.negative[idx], result.mantissa[idx], result.scale[idx] = value < 0, abs(value), value_scale
+
+    done = set(done)
+    return [idx for idx in range(len(column1)) if idx not in done]
+
+
+def _normalized(mantissa, scale):
+    """Strip the trailing decimal zeros from arrays of mantissas, as `bignum.filtered` does."""
+    scale = np.where(mantissa == 0, np.minimum(scale, 0), scale)
+    while True:
+        strip = (scale > 0) & (mantissa % 10 == 0) & (mantissa != 0)
+        if not strip.any():
+            return mantissa, scale
+        mantissa = np.where(strip, mantissa // 10, mantissa)
+        scale = scale - strip
+
+
+def _powers_of_ten(exponents):
+    """
+    Look up 10**exponent for an array of exponents.
+
+    Returns:
+        The powers, and a mask of the exponents that fit in a signed 64-bit integer.
+    """
+    table = np.array([10**k for k in range(19)], dtype=np.int64)
+    ok = (exponents >= 0) & (exponents <= 18)
+    return table[np.clip(exponents, 0, 18)], ok
+
+
+def _aligned(mantissa1, scale1, mantissa2, scale2):
+    """Bring two arrays of mantissas to a common scale, keeping every aligned value below 2**62."""
+    scale = np.maximum(scale1, scale2)
+    power1, ok1 = _powers_of_ten(scale - scale1)
+    power2, ok2 = _powers_of_ten(scale - scale2)
+    ok = ok1 & ok2 & (np.abs(mantissa1) < _WORD_LIMIT // power1) & (np.abs(mantissa2) < _WORD_LIMIT // power2)
+    return mantissa1 * power1, mantissa2 * power2, scale, ok
+
+
+def _add_kernel(mantissa1, scale1, mantissa2, scale2):
+    aligned1, aligned2, scale, ok = _aligned(mantissa1, scale1, mantissa2, scale2)
+    return aligned1 + aligned2, scale, ok
+
+
+def _subtract_kernel(mantissa1, scale1, mantissa2, scale2):
+    aligned1, aligned2, scale, ok = _aligned(mantissa1, scale1, mantissa2, scale2)
+    return aligned1 - aligned2, scale, ok
+
+
+def _multiply_kernel(mantissa1, scale1, mantissa2, scale2):
+    ok = np.abs(mantissa1) < _WORD_LIMIT // np.maximum(np.abs(mantissa2), 1)
+    return mantissa1 * mantissa2, scale1 + scale2, ok
+
+
+def _divide_kernel(precision: int) -> Callable:
+    def kernel(mantissa1, scale1, mantissa2, scale2):
+        # The quotient with `precision` decimals is mantissa1 * 10**shift / mantissa2, truncated.
+        shift = precision + scale2 - scale1
+        power, ok_dividend = _powers_of_ten(shift)
+        ok_dividend &= np.abs(mantissa1) < _WORD_LIMIT // power
+        power_divisor, ok_divisor = _powers_of_ten(-shift)
+        ok_divisor &= np.abs(mantissa2) < _WORD_LIMIT // power_divisor
+        dividend = np.where(shift >= 0, np.abs(mantissa1) * power, np.abs(mantissa1))
+        divisor = np.where(shift >= 0, np.abs(mantissa2), np.abs(mantissa2) * power_divisor)
+        quotient = dividend // divisor
+        quotient = np.where((mantissa1 < 0) != (mantissa2 < 0), -quotient, quotient)
+        return quotient, np.full_like(scale1, precision), np.where(shift >= 0, ok_dividend, ok_divisor)
+    return kernel
+
+
+def add(xs: Iterable, ys: Iterable) -> Column:
+    """
+    Calculate the sums of pairs of values.
+
+    Examples:
+        >>> add(["1.5", "2", "-3"], ["2.25", "-5", "10"]).to_list()
+        [bignum('3.75'), bignum('-3'), bignum('7')]
+    """
+    return _apply(xs, ys, _add_kernel, _adder.add_two_nums)
+
+
+def subtract(xs: Iterable, ys: Iterable) -> Column:
+    """
+    Calculate the differences of pairs of values.
+
+    Examples:
+        >>> subtract(["1.5", "2"], ["2.25", "-5"]).to_list()
+        [bignum('-0.75'), bignum('7')]
+    """
+    return _apply(xs, ys, _subtract_kernel, _subtractor.subtract_two_nums)
+
+
+def multiply(xs: Iterable, ys: Iterable) -> Column:
+    """
+    Calculate the products of pairs of values.
+
+    Examples:
+        >>> multiply(["1.5", "-2", "3" * 30], ["2.5", "4", "3"]).to_list()
+        [bignum('3.75'), bignum('-8'), bignum('999999999999999999999999999999')]
+    """
+    return _apply(xs, ys, _multiply_kernel, _multiplier.multiply_two_nums)
+
+
+def divide(xs: Iterable, ys: Iterable, precision: Optional[int] = None) -> Column:
+    """
+    Calculate the quotients of pairs of values.
+
+    Args:
+        precision (int): The number of decimal places to keep. Digits beyond it are truncated (default: None,
+        as the `/` operator: the precision of the current context, or the whole quotient if it has none).
+
+    Examples:
+        >>> divide(["10", "-1"], ["4", "3"], precision=2).to_list()
+        [bignum('2.5'), bignum('-0.33')]
+        >>> from bignum.context import localcontext
+        >>> with localcontext(precision=5):
+        ...     divide(["1", "-2"], ["3", "7"]).to_list() == [bignum("1") / bignum("3"), bignum("-2") / bignum("7")]
+        True
+    """
+    divisors = Column.from_values(ys)
+    if not all(divisors.mantissa):
+        raise ValueError("Division by zero")
+    if precision is not None:
+        precision = max(precision, 0)
+        kernel = _divide_kernel(precision)
+    else:
+        # Quotients are rounded to the context precision by the scalar engine. Without one,
+        # they are truncated to the whole part, which is what the kernel computes with no decimals.
+        kernel = _divide_kernel(0) if getcontext().precision is None else None
+    return _apply(xs, divisors, kernel, lambda num1, num2: _divider.divide_two_nums(num1, num2, precision))
@@ -1,39 +1,186 @@
 from __future__ import annotations
-from typing import Tuple, Union, Iterable
-import gmpy2
+from typing import Tuple, Union, Iterable, Optional
+from decimal import Decimal
+import math
+import re
+
+from .radix import digits_to_int, int_to_digits, digit_count
+from . import instrument
+
+_NUMBER_PATTERN = re.compile(r'\s*([+-]?)(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?\s*')
+
+_LOG10_2 = math.log10(2)
+
+
+def _strip_trailing_zeros(mantissa: int, limit: int) -> Tuple[int, int]:
+    """
+    Remove up to `limit` trailing zeros from `mantissa`.
+    
+    Returns:
+        Tuple[int, int]: The stripped mantissa and the number of zeros removed.
+    """
+    if not mantissa:
+        return 0, max(limit, 0)
+    removed, step = 0, 1
+    while removed < limit:
+        step = min(step, limit - removed)
+        quotient, remainder = divmod(mantissa, 10 ** step)
+        if remainder:
+            if step == 1:
+                break
+            step = 1
+            continue
+        mantissa, removed, step = quotient, removed + step, step * 2
+    return mantissa, removed
+
 
 class bignum:
-    __slots__ = {'__val'}
+    """
+    An arbitrary precision decimal number.
+    
+    The value is kept in two interchangeable forms, each built lazily from the other:
+    - The decimal string, as given by the user or as rendered by `__str__`.
+    - The numeric parts: a sign, an integer mantissa holding every digit, and a scale 
+    giving the number of digits after the decimal point (value = mantissa * 10**-scale).
+    The operation engines work on the numeric parts, so intermediate results are never 
+    converted to text.
+    
+    Instances are immutable: every method returns a new value. This allows derived views 
+    (whole part, decimal part, filtered forms) to be computed once on first access and 
+    kept in slots for the lifetime of the instance.
+    """
+    __slots__ = ('_val', '_negative', '_mantissa', '_scale',
+                 '_split', '_whole', '_decimal', '_has_decimal', '_filtered_whole', '_filtered_decimal', '_filtered', '_bytes')
+    
+    def __init__(self, value: Union[str, int, bignum]):
+        if isinstance(value, bignum):
+            for slot in bignum.__slots__:
+                setattr(self, slot, getattr(value, slot))
+            return
+        if isinstance(value, int) and not isinstance(value, bool):
+            self._set(None, value < 0, abs(value), 0)
+            return
+        value = str(value)
+        if not bignum.is_num(value):
+            raise ValueError(f"Invalid value: {value}")
+        self._set(value, value.lstrip().startswith('-'), None, None)
+    
+    def _set(self, val: Optional[str], negative: bool, mantissa: Optional[int], scale: Optional[int]):
+        """Initialise the slots. Derived views start out empty and are filled in on first use."""
+        self._val, self._negative, self._mantissa, self._scale = val, negative, mantissa, scale
+        self._split = self._whole = self._decimal = self._has_decimal = None
+        self._filtered_whole = self._filtered_decimal = self._filtered = None
+        self._bytes = None
+        if instrument.active is not None:
+            instrument.active.count('bignum.allocations')
+    
+    @classmethod
+    def _from_trusted(cls, value: str) -> bignum:
+        """
+        Build a bignum from a string that is already known to be a valid number, skipping `is_num`.
+        
+        Only values derived from an already validated bignum should be passed here; 
+        user input must go through the regular constructor.
+        """
+        num = object.__new__(cls)
+        num._set(value, value.startswith('-'), None, None)
+        return num
+    
+    @classmethod
+    def _from_parts(cls, negative: bool, mantissa: int, scale: int = 0) -> bignum:
+        """Build a bignum directly from its numeric parts, without building or validating a string."""
+        num = object.__new__(cls)
+        num._set(None, negative, mantissa, scale)
+        return num
+    
+    def _parts(self) -> Tuple[bool, int, int]:
+        """
+        Get the numeric parts of the value, parsing the decimal string on first use.
+        
+        Returns:
+            Tuple[bool, int, int]: The sign (True if negative), the mantissa and the scale.
+            
+        Examples:
+            >>> bignum("-0012.3400")._parts()
+            (True, 123400, 4)
+            >>> bignum("-.5")._parts()
+            (True, 5, 1)
+        """
+        if self._mantissa is None:
+            if instrument.active is not None:
+                with instrument.active.timer('bignum.parse'):
+                    self._parse()
+            else:
+                self._parse()
+        return self._negative, self._mantissa, self._scale
+    
+    def _parse(self):
+        match = _NUMBER_PATTERN.fullmatch(self._val)
+        if match is None or not (match[2] or match[3]):
+            raise ValueError(f"Invalid value: {self._val}")
+        decimal = match[3] or ''
+        self._mantissa = digits_to_int(f"{match[2]}{decimal}")
+        self._scale = len(decimal) - int(match[4] or 0)
     
-    def __init__(self, value: str):
-        self.__val = str(value)
-        if not bignum.is_num(self.__val):
-            raise ValueError(f"Invalid value: {self.__val}")
+    @staticmethod
+    def _align_scales(num1: bignum, num2: bignum) -> Tuple[int, int, int]:
+        """
+        Bring the mantissas of two values to a common scale.
+        
+        Returns:
+            Tuple[int, int, int]: The two aligned mantissas and their common scale.
+            
+        Examples:
+            >>> bignum._align_scales(bignum("7.120"), bignum("5.4"))
+            (7120, 5400, 3)
+        """
+        _, mantissa1, scale1 = num1._parts()
+        _, mantissa2, scale2 = num2._parts()
+        if scale1 == scale2:
+            return mantissa1, mantissa2, scale1
+        if instrument.active is not None:
+            instrument.active.count('bignum.align_scales')
+        scale = max(scale1, scale2)
+        return mantissa1 * 10**(scale - scale1), mantissa2 * 10**(scale - scale2), scale
         
     def __str__(self) -> str:
-        return self.__val
+        if self._val is None:
+            digits = int_to_digits(self._mantissa, self._scale + 1)
+            if self._scale > 0:
+                digits = f"{digits[:-self._scale]}.{digits[-self._scale:]}"
+            elif self._scale < 0 and self._mantissa:
+                digits += '0' * -self._scale
+            self._val = f"-{digits}" if self._negative else digits
+        return self._val
     
     def __int__(self) -> str:
-        return int(str(self.get_whole()))
+        negative, mantissa, scale = self._parts()
+        whole = mantissa // 10**scale if scale >= 0 else mantissa * 10**-scale
+        return -whole if negative else whole
     
     def __float__(self) -> str:
-        return float(str(self.__val))
+        return float(str(self))
     
     def __repr__(self) -> str:
-        return f"bignum('{self.__val}')"
+        return f"bignum('{self}')"
     
     def __bool__(self) -> bool:
-        return bool(self.__val)
+        return bool(self._parts()[1])
         
     def __getitem__(self, idx: Union[int, slice]) -> bignum:
-        return bignum(self.__val[idx])
+        item = str(self)[idx]
+        return bignum._from_trusted(item) if item.isdecimal() else bignum(item)
     
     def __abs__(self) -> bignum:
         """Return the absolute value of the number."""
-        return bignum(self.__val[1:] if self.is_negative() else self.__val)
+        if not self.is_negative():
+            return self
+        if self._mantissa is not None:
+            return bignum._from_parts(False, self._mantissa, self._scale)
+        return bignum._from_trusted(self._val.lstrip()[1:])
     
     def __len__(self) -> bignum:
-        return len(self.__val)
+        return len(str(self))
     
     @staticmethod
     def is_num(val: str, scientific_notation=False) -> bool:
@@ -43,12 +190,14 @@ class bignum:
         Args:
             val (str): The value to be checked.
             scientific_notation (bool): Whether scientific notation is allowed (default: False).
+            
+        Examples:
+            >>> [bignum.is_num(val) for val in ("-12.5", " .5 ", "5.", "7e3", "inf", "1_000", "0x10", "")]
+            [True, True, True, False, False, False, False, False]
         """
-        try:
-            gmpy2.mpfr(str(val))
-            return bool(scientific_notation) if "e" in val else True
-        except ValueError:
-            return False
+        # The same grammar as `_parse`, so every value accepted here can be parsed.
+        match = _NUMBER_PATTERN.fullmatch(str(val))
+        return match is not None and bool(match[2] or match[3]) and (bool(scientific_notation) or match[4] is None)
     
     def has_decimal(self, include_trailing_zeros=False) -> bool:
         """
@@ -57,29 +206,65 @@ class bignum:
         Args:
             include_trailing_zeros (bool): Whether to consider trailing zeros after the decimal point (default: False).
         """
-        return bool('.' in self.__val and (True if include_trailing_zeros else self.__val.split('.')[1].rstrip('0')))
+        _, decimal = self._split_point()
+        if decimal is None:
+            return False
+        if include_trailing_zeros:
+            return True
+        if self._has_decimal is None:
+            self._has_decimal = bool(decimal.rstrip('0'))
+        return self._has_decimal
+    
+    def _split_point(self) -> Tuple[str, Optional[str]]:
+        """Split the string form at the decimal point. The decimal part is None if there is no decimal point."""
+        if self._split is None:
+            whole, point, decimal = str(self).partition('.')
+            self._split = (whole, decimal if point else None)
+        return self._split
     
     def get_decimal(self) -> bignum:
         """Get the decimal part of the value."""
-        return bignum(self.__val.split(".")[1] if self.has_decimal() else '0')
+        if self._decimal is None:
+            self._decimal = bignum._from_trusted(self._split_point()[1] if self.has_decimal() else '0')
+        return self._decimal
     
     def get_whole(self) -> bignum:
         """Get the whole part of the value."""
-        return bignum(self.__val.split('.')[0] if self.has_decimal(True) else self.__val)
+        if self._whole is None:
+            self._whole = bignum._from_trusted(self._split_point()[0])
+        return self._whole
     
     def is_negative(self) -> bool: 
         """Check if the value is negative."""
-        return self.__val.startswith('-')
+        return self._negative
     
     def is_positive(self) -> bool: 
         """Check if the value is positive."""
-        return not self.__val.startswith('-')
+        return not self._negative
     
     to_positive = __abs__
     
     def to_negative(self) -> bool:
         """Return the negative form of the number."""
-        return bignum(f"{'-' if self.is_positive() else ''}{self.__val}")
+        if self._negative:
+            return self
+        if self._mantissa is not None:
+            return bignum._from_parts(True, self._mantissa, self._scale)
+        return bignum._from_trusted(f"-{self._val.lstrip().lstrip('+')}")
+    
+    def negate(self) -> bignum:
+        """
+        Return the value with its sign flipped. Zero stays unsigned.
+        
+        Examples:
+            >>> bignum("-12.5").negate()
+            bignum('12.5')
+            >>> bignum("0").negate()
+            bignum('0')
+        """
+        if self.is_negative():
+            return self.to_positive()
+        return self.to_negative() if self else self
     
     def rjust(self, width: int, fillchar=' ') -> bignum:
         """
@@ -89,7 +274,8 @@ class bignum:
             width (int): The width of the resulting value.
             fillchar (str): The character used for filling (default: ' ').
         """
-        return bignum(self.__val.rjust(width, fillchar))
+        result = str(self).rjust(width, fillchar)
+        return bignum._from_trusted(result) if fillchar == '0' and self.is_positive() else bignum(result)
     
     def ljust(self, width: int, fillchar=' ') -> bignum:
         """
@@ -99,7 +285,8 @@ class bignum:
             width (int): The width of the resulting value.
             fillchar (str): The character used for filling (default: ' ').
         """
-        return bignum(self.__val.ljust(width, fillchar))
+        result = str(self).ljust(width, fillchar)
+        return bignum._from_trusted(result) if fillchar == '0' else bignum(result)
     
     def split(self, x: str) -> list[bignum]: 
         """
@@ -111,11 +298,11 @@ class bignum:
         Returns:
             list[bignum]: A list of bignum instances resulting from the split.
         """
-        return [bignum(item) for item in self.__val.split(x)]
+        return [bignum(item) for item in str(self).split(x)]
     
     def as_numerical_dtype(self) -> Union[float, int]:
         """Returns an integer or a float, based on the presence of a decimal part."""
-        return float(self.__val) if self.has_decimal() else int(self.filtered())
+        return float(self) if self.has_decimal() else int(self)
     
     def chunk_whole(self, chunk_size: int, reverse=False, item_type = str) -> Iterable[int]:
         """
@@ -137,11 +324,11 @@ class bignum:
             [890, 567, 234, 1]
 
         """
-        whole = self.get_whole()
+        whole = str(self.get_whole())
         chunk_iterator = range(len(whole), 0, -chunk_size)
         if not reverse:
             chunk_iterator = reversed(chunk_iterator)
-        chunks = (item_type(str(whole[max(i-chunk_size, 0):i])) for i in chunk_iterator)
+        chunks = (item_type(whole[max(i-chunk_size, 0):i]) for i in chunk_iterator)
         return chunks
     
     def chunk_decimal(self, chunk_size: int, reverse=False, filter_before_chunking=False, item_type = str) -> Iterable[int]:
@@ -195,14 +382,15 @@ class bignum:
         decimal_1 = f"{decimal_1}{'0'*(len(decimal_2)-len(decimal_1))}"
         decimal_2 = f"{decimal_2}{'0'*(len(decimal_1)-len(decimal_2))}"
         if decimal_only:
-            return tuple(map(bignum, (decimal_1, decimal_2)))
+            return tuple(map(bignum._from_trusted, (decimal_1, decimal_2)))
         res1 = f"{num1.get_whole()}.{decimal_1}"
         res2 = f"{num2.get_whole()}.{decimal_2}"
-        return tuple(map(bignum, (res1, res2)))
+        return tuple(map(bignum._from_trusted, (res1, res2)))
 
     def shift_decimals_left(self, places: int, filter_=False) -> bignum:
         """
         Shift the decimal point of the value to the left by a specified number of places.
+        Only the scale changes; the digits are not touched until the value is printed.
 
         Args:
             places (int): The number of places to shift the decimal point.
@@ -220,23 +408,14 @@ class bignum:
         >>> b.shift_decimals_left(10)
         bignum('0.0123450010')
         """
-        if places < 0:
-            return self.shift_decimals_right(abs(places), filter_)
-        neg = self.is_negative()
-        whole = self.get_whole().to_positive()
-        decimal = self.get_decimal() if self.get_decimal().filtered() != '0' else ''
-        if places >= len(whole):
-            whole = bignum(f"0.{'0'*(places-len(whole))}{whole}{decimal}")
-            return whole.filtered() if filter_ else whole
-        num_left = whole[:~(places-1)]
-        num_right = whole[~(places-1):]
-        result = bignum(f"{num_left}.{num_right}{decimal}")
-        result = result.to_negative() if neg else result
+        negative, mantissa, scale = self._parts()
+        result = bignum._from_parts(negative, mantissa, scale + int(places))
         return result.filtered() if filter_ else result
     
     def shift_decimals_right(self, places, filter_=False) -> bignum:
         """
         Shift the decimal point of the value to the right by a specified number of places.
+        Only the scale changes; the digits are not touched until the value is printed.
 
         Args:
             places (int): The number of places to shift the decimal point.
@@ -254,18 +433,7 @@ class bignum:
         >>> b.shift_decimals_right(6)
         bignum('12345000')
         """
-        places = int(places)
-        if places < 0:
-            return self.shift_decimals_left(abs(places), filter_)
-        neg = self.is_negative()
-        whole, decimal = self.get_whole().to_positive(), self.get_decimal()
-        if places > len(decimal):
-            decimal = str(decimal) + '0'*(places-len(decimal))
-        whole = f"{whole}{decimal[:places]}"
-        decimal = f"{decimal[places:]}"
-        result = bignum(f"{whole}.{decimal}" if decimal else whole)
-        result = result.to_negative() if neg else result
-        return result.filtered() if filter_ else result
+        return self.shift_decimals_left(-int(places), filter_)
     
     def filter_whole(self) -> bignum:
         """
@@ -280,8 +448,11 @@ class bignum:
             >>> bignum("-00192").filter_whole()
             bignum('-192')
         """
-        result = (f"-{str(self.get_whole()[1:]).lstrip('0')}" if self.get_whole().is_negative() else str(self.get_whole()).lstrip('0')) or '0'
-        return bignum('0') if str(result) == '-' else bignum(result)
+        if self._filtered_whole is None:
+            whole = str(self.get_whole())
+            result = (f"-{whole[1:].lstrip('0')}" if self.get_whole().is_negative() else whole.lstrip('0')) or '0'
+            self._filtered_whole = bignum._from_trusted('0' if result == '-' else result)
+        return self._filtered_whole
     
     def filter_decimal(self) -> bignum:
         """
@@ -294,7 +465,9 @@ class bignum:
             >>> bignum("2.01900").filter_decimal()
             bignum('019')
         """
-        return bignum(str(self.get_decimal()).rstrip('0') or '0')
+        if self._filtered_decimal is None:
+            self._filtered_decimal = bignum._from_trusted(str(self.get_decimal()).rstrip('0') or '0')
+        return self._filtered_decimal
     
     def filtered(self) -> bignum:
         """
@@ -304,10 +477,17 @@ class bignum:
             >>> bignum("-0020.01900").filtered()
             bignum('-20.019')
         """
-        whole = self.filter_whole()
-        decimal = self.filter_decimal()
-        result = bignum(f"{whole}.{decimal}" if str(decimal) != '0' else whole)
-        return result
+        if self._filtered is None:
+            negative, mantissa, scale = self._parts()
+            if instrument.active is not None:
+                with instrument.active.timer('bignum.filtered'):
+                    mantissa, removed = _strip_trailing_zeros(mantissa, scale)
+            else:
+                mantissa, removed = _strip_trailing_zeros(mantissa, scale)
+            self._filtered = bignum._from_parts(negative and bool(mantissa), mantissa, scale - removed)
+            # A filtered value is its own filtered form.
+            self._filtered._filtered = self._filtered
+        return self._filtered
     
     def truncate_decimal(self, num_decimals: int) -> bignum:
         """
@@ -326,64 +506,315 @@ class bignum:
         if num_decimals <= 0: 
             return self.get_whole()
         if not self.has_decimal(True):
-            return bignum(f"{self}.{'0' * num_decimals}")
-        result = bignum(f"{self.get_whole()}.{self.get_decimal()[:num_decimals]}{'0'*(num_decimals-len(self.get_decimal()))}")
+            return bignum._from_trusted(f"{self}.{'0' * num_decimals}")
+        result = bignum._from_trusted(f"{self.get_whole()}.{self.get_decimal()[:num_decimals]}{'0'*(num_decimals-len(self.get_decimal()))}")
         return result
     
-    
-    def __gt__(self, val: bignum) -> bool:
-        """Check if the value is greater than another value"""
-        def gt_positive(num1: bignum, num2: bignum) -> Tuple[bool, str]:
-            chunk_size = 500
+    def truncate_decimal_to_significant_digit(self, digits: int) -> bignum:
+        """
+        Truncate the decimal part so that no more than `digits` significant digits remain. 
+        Digits of the whole part are never removed.
+        
+        Examples:
+            >>> bignum('0.000123456').truncate_decimal_to_significant_digit(4)
+            bignum('0.0001234')
+            >>> bignum('12.3456').truncate_decimal_to_significant_digit(4)
+            bignum('12.34')
+            >>> bignum('123456.7').truncate_decimal_to_significant_digit(4)
+            bignum('123456')
+        """
+        negative, mantissa, scale = self._parts()
+        places = max(scale - (digit_count(mantissa) - digits), 0)
+        return bignum._from_parts(negative, *round_parts(negative, mantissa, scale, places, ROUND_DOWN))
+    
+    def _rescale(self, places: int, rounding: Optional[str]) -> bignum:
+        """Round or pad the value to exactly `places` decimal places."""
+        negative, mantissa, scale = self._parts()
+        if places > scale:
+            mantissa, scale = mantissa * 10**(places - scale), places
+        else:
+            mantissa, scale = round_parts(negative, mantissa, scale, places, rounding or getcontext().rounding)
+        return bignum._from_parts(negative and bool(mantissa), mantissa, scale)
+    
+    def round(self, places: int = 0, rounding: Optional[str] = None) -> bignum:
+        """
+        Round to the given number of decimal places. Negative places round to tens, hundreds and so on.
+        
+        Args:
+            rounding (str): One of the modes in `bignum.context` (default: None, the mode of the current context).
             
-            num1 = num1.filtered()
-            num2 = num2.filtered()
+        Examples:
+            >>> bignum('2.675').round(2), bignum('2.665').round(2), bignum('-2.665').round(2, 'floor')
+            (bignum('2.68'), bignum('2.66'), bignum('-2.67'))
+            >>> bignum('1250').round(-2), bignum('1.5').round(3)
+            (bignum('1200'), bignum('1.500'))
+        """
+        return self._rescale(places, rounding)
+    
+    def __round__(self, ndigits: Optional[int] = None):
+        return int(self.round()) if ndigits is None else self.round(ndigits)
+    
+    def quantize(self, exp, rounding: Optional[str] = None) -> bignum:
+        """
+        Round or pad the value to the same number of decimal places as `exp`.
+        
+        Examples:
+            >>> bignum('3.14159').quantize('0.01'), bignum('3').quantize('0.01')
+            (bignum('3.14'), bignum('3.00'))
+        """
+        return self._rescale(bignum(exp)._parts()[2], rounding)
+    
+    def round_significant(self, digits: int, rounding: Optional[str] = None) -> bignum:
+        """
+        Round to the given number of significant digits.
+        
+        Examples:
+            >>> bignum('0.00123456').round_significant(3), bignum('987654').round_significant(2, 'down')
+            (bignum('0.00123'), bignum('980000'))
+        """
+        negative, mantissa, scale = self._parts()
+        return bignum._from_parts(negative, *round_to_precision(negative, mantissa, scale, digits, rounding or getcontext().rounding))
+    
+    
+    def compare(self, val: bignum) -> int:
+        """
+        Compare the value with another value.
+        
+        Magnitudes are first told apart by the bit lengths of the mantissas, so values of 
+        different size are ordered without touching their digits. Only values of similar size 
+        are brought to a common scale and compared as integers.
 
-            num1_whole = num1.get_whole()
-            num2_whole = num2.get_whole()
-            if len(num1_whole) != len(num2_whole): 
-                return len(num1_whole) > len(num2_whole), False
-            
-            num1_whole_chunks = num1.chunk_whole(chunk_size)
-            num2_whole_chunks = num2.chunk_whole(chunk_size)
-            for (num1_whole_chunk, num2_whole_chunk) in zip(num1_whole_chunks, num2_whole_chunks):
-                if num1_whole_chunk != num2_whole_chunk:
-                    return (num1_whole_chunk > num2_whole_chunk, False)
-            
-            num1, num2 = bignum.equalize_decimals(num1, num2)
-            num1_decimal_chunks = num1.chunk_decimal(chunk_size)
-            num2_decimal_chunks = num2.chunk_decimal(chunk_size)
-            for (num1_decimal_chunk, num2_decimal_chunk) in zip(num1_decimal_chunks, num2_decimal_chunks):
-                if num1_decimal_chunk != num2_decimal_chunk:
-                    return (num1_decimal_chunk > num2_decimal_chunk, False)
-            
-            return [False, True]
+        Returns:
+            int: -1 if the value is smaller, 0 if both are equal and 1 if the value is greater.
             
-        val = bignum(val)
-        if self.is_negative() and not val.is_negative(): 
-            return False
-        if not self.is_negative() and val.is_negative(): 
-            return True
-        if self.is_negative() and val.is_negative(): 
-            gt, eq = gt_positive(abs(self), abs(val))
-            return False if eq else not gt
-        return gt_positive(self, val)[0]
+        Examples:
+            >>> bignum("12.50").compare("0012.5")
+            0
+            >>> bignum("-3").compare("2")
+            -1
+            >>> bignum("100").compare("99.999")
+            1
+            >>> bignum("-0").compare("0")
+            0
+        """
+        val = val if isinstance(val, bignum) else bignum(val)
+        negative1, mantissa1, scale1 = self._parts()
+        negative2, mantissa2, scale2 = val._parts()
+        sign1 = (-1 if negative1 else 1) if mantissa1 else 0
+        sign2 = (-1 if negative2 else 1) if mantissa2 else 0
+        if sign1 != sign2:
+            return 1 if sign1 > sign2 else -1
+        if not sign1:
+            return 0
+        
+        # log10 of a mantissa with bit length n lies in [(n-1)*log10(2), n*log10(2)).
+        bits1, bits2 = mantissa1.bit_length(), mantissa2.bit_length()
+        if bits1 * _LOG10_2 - scale1 + 1 < (bits2 - 1) * _LOG10_2 - scale2:
+            return -sign1
+        if bits2 * _LOG10_2 - scale2 + 1 < (bits1 - 1) * _LOG10_2 - scale1:
+            return sign1
+        
+        if scale1 < scale2:
+            mantissa1 *= 10**(scale2 - scale1)
+        elif scale2 < scale1:
+            mantissa2 *= 10**(scale1 - scale2)
+        return ((mantissa1 > mantissa2) - (mantissa1 < mantissa2)) * sign1
     
+    def __gt__(self, val: bignum) -> bool:
+        """Check if the value is greater than another value"""
+        return self.compare(val) > 0
     
     def __lt__(self, val: bignum) -> bool:
         """Check if a value is less than another value."""
-        return bignum(val) > self
+        return self.compare(val) < 0
     
     def __eq__(self, val: bignum) -> bool:
         """Check if a value is equal to another value."""
-        return str(self.filtered()) == str(bignum(val).filtered())
+        return self.compare(val) == 0
+    
+    def __ne__(self, val: bignum) -> bool:
+        """Check if a value is not equal to another value."""
+        return self.compare(val) != 0
     
     def __ge__(self, val: bignum) -> bool:
         """Check if a value is greater than or equal to another value."""
-        return (self > bignum(val) or self == bignum(val))
+        return self.compare(val) >= 0
     
     def __le__(self, val: bignum) -> bool:
         """Check if a value is less than or equal to another value."""
-        return (self < bignum(val) or self == bignum(val))
+        return self.compare(val) <= 0
+    
+    @staticmethod
+    def _coerce(val) -> Optional[bignum]:
+        """Convert an arithmetic operand into a bignum, or return None if its type is not supported."""
+        if isinstance(val, bignum):
+            return val
+        if isinstance(val, (int, str, float, Decimal)) and not isinstance(val, bool):
+            return bignum(val)
+        return None
+    
+    # Arithmetic operators dispatch straight to the operation engines.
+    # bignum is immutable, so the in-place forms rebind the name to a new value, like int.
+    
+    def __add__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _adder.add_two_nums(self, val)
+    
+    def __radd__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _adder.add_two_nums(val, self)
+    
+    def __sub__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _subtractor.subtract_two_nums(self, val)
+    
+    def __rsub__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _subtractor.subtract_two_nums(val, self)
+    
+    def __mul__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _multiplier.multiply_two_nums(self, val)
+    
+    def __rmul__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _multiplier.multiply_two_nums(val, self)
+    
+    def __truediv__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _divider.divide_two_nums(self, val)
+    
+    def __rtruediv__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _divider.divide_two_nums(val, self)
+    
+    def __pow__(self, val, mod=None) -> bignum:
+        val = bignum._coerce(val)
+        if val is None or (mod is not None and bignum._coerce(mod) is None):
+            return NotImplemented
+        return _power.power(self, val, None if mod is None else bignum._coerce(mod))
+    
+    def __rpow__(self, val) -> bignum:
+        val = bignum._coerce(val)
+        return NotImplemented if val is None else _power.power(val, self)
+    
+    @staticmethod
+    def pow(base, exp, mod=None) -> bignum:
+        """
+        Raise `base` to the whole power `exp`, optionally modulo `mod` (see `operations.power.Power.power`).
+        
+        Examples:
+            >>> bignum.pow("1.5", 3), bignum("2") ** 10, pow(bignum(4), 13, 497)
+            (bignum('3.375'), bignum('1024'), bignum('445'))
+        """
+        return _power.power(base, exp, mod)
+    
+    def sqrt(self, digits: Optional[int] = None) -> bignum:
+        """
+        Calculate the square root, rounded to `digits` significant digits or the precision of the current context
+        (see `operations.root.Root.nth_root`).
+        
+        Examples:
+            >>> bignum("2").sqrt(10), bignum("6.25").sqrt()
+            (bignum('1.414213562'), bignum('2.5'))
+        """
+        return _root.nth_root(self, 2, digits)
+    
+    def nth_root(self, n: int, digits: Optional[int] = None) -> bignum:
+        """
+        Calculate the n-th root, rounded to `digits` significant digits or the precision of the current context.
+        
+        Examples:
+            >>> bignum("10").nth_root(3, 12), bignum("-32").nth_root(5)
+            (bignum('2.15443469003'), bignum('-2'))
+        """
+        return _root.nth_root(self, n, digits)
+    
+    def isqrt(self) -> bignum:
+        """
+        Calculate the integer square root of a non-negative whole number.
+        
+        Examples:
+            >>> bignum("1000000").isqrt(), bignum("1000001").isqrt(), bignum("999999").isqrt()
+            (bignum('1000'), bignum('1000'), bignum('999'))
+        """
+        return _root.isqrt(self)
+    
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
+    __ipow__ = __pow__
+    
+    def __neg__(self) -> bignum:
+        return self.negate()
+    
+    def __pos__(self) -> bignum:
+        # As with `decimal`, the unary plus applies the current context.
+        return getcontext().apply(self)
+    
+    @staticmethod
+    def from_file(file) -> bignum:
+        """
+        Read the first number from a path or an open file. The digits are parsed as they are read, 
+        without loading the whole number as a string (see `stream.from_file`).
+        """
+        return stream.from_file(file)
     
-from .operations.add import add
+    @staticmethod
+    def from_buffer(buffer) -> bignum:
+        """
+        Parse a bytes-like object, such as an mmap, that holds exactly one number.
+        
+        Examples:
+            >>> bignum.from_buffer(b"-12.5\\n")
+            bignum('-12.5')
+        """
+        return stream.from_buffer(buffer)
+    
+    def to_file(self, file):
+        """Write the number to a path or an open file, one block of digits at a time (see `stream.to_file`)."""
+        stream.to_file(self, file)
+    
+    def to_bytes(self) -> bytes:
+        """
+        Encode the value in the versioned binary wire format: sign, scale and little-endian 
+        64-bit limbs of the mantissa (see `wire`). The encoding is computed once and cached.
+        
+        Examples:
+            >>> bignum.from_bytes(bignum("-12.50").to_bytes())
+            bignum('-12.50')
+        """
+        if self._bytes is None:
+            self._bytes = wire.encode(*self._parts())
+        return self._bytes
+    
+    @staticmethod
+    def from_bytes(buffer) -> bignum:
+        """Decode a value from the binary wire format. Any bytes-like object is accepted and the limbs are read in place."""
+        return wire.decode(buffer)
+    
+    def to_memoryview(self) -> memoryview:
+        """Return a read-only view of the cached binary encoding, so repeated exports share one buffer."""
+        return memoryview(self.to_bytes())
+    
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+    
+    def __setstate__(self, state: bytes):
+        self._set(None, *wire.decode_parts(state))
+    
+    def __reduce__(self):
+        return bignum.from_bytes, (self.__getstate__(),)
+    
+from .operations.add import add, Add
+from .operations.subtract import Subtract
+from .operations.multiply import Multiply
+from .operations.division import Divide
+from .operations.power import Power
+from .operations.root import Root
+from .context import getcontext, round_parts, round_to_precision, ROUND_DOWN
+
+_adder, _subtractor, _multiplier, _divider, _power, _root = Add(), Subtract(), Multiply(), Divide(), Power(), Root()
+
+from . import stream, wire
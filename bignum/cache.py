@@ -0,0 +1,106 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+import threading
+
+from .bignum import bignum
+
+# Rough per-entry cost of the key tuple, the entry in the ordered dict and the bignum instance, in bytes.
+_ENTRY_OVERHEAD = 400
+
+
+class ResultCache:
+    """
+    A thread-safe memo of operation results with least-recently-used eviction.
+
+    Entries are keyed on the operation and the numeric parts of the filtered operands, so equal values
+    written differently ("1.50" and "1.5") share an entry, and lookups never touch the decimal strings.
+    The cache holds at most `max_bytes` of mantissa data; the least recently used entries are evicted
+    to stay within it.
+
+    Examples:
+        >>> cache = ResultCache(max_bytes=1024)
+        >>> key = cache.key('*', bignum("1.50"), bignum("2"))
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, bignum("3"))
+        >>> cache.get(key)
+        bignum('3')
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'size_bytes': 401, 'max_bytes': 1024}
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        self._entries: OrderedDict[Hashable, Tuple[bignum, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(operation: str, *operands: bignum, extra: Hashable = None) -> Tuple:
+        """
+        Build the cache key of an operation.
+
+        Args:
+            operation (str): The name of the operation.
+            operands: The operands, in order.
+            extra: Any further argument that changes the result, such as the precision of a division.
+        """
+        return (operation, extra, *(operand.filtered()._parts() for operand in operands))
+
+    @staticmethod
+    def _entry_size(key: Tuple, value: bignum) -> int:
+        bits = value._parts()[1].bit_length()
+        bits += sum(part[1].bit_length() for part in key[2:])
+        return bits // 8 + _ENTRY_OVERHEAD
+
+    def get(self, key: Tuple) -> Optional[bignum]:
+        """Return the cached result for `key`, or None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple, value: bignum):
+        """Store a result, evicting the least recently used entries to stay within the byte budget."""
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_bytes': self.size_bytes,
+                'max_bytes': self.max_bytes,
+            }
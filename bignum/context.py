@@ -0,0 +1,177 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional, Tuple
+
+from .radix import digit_count
+from . import instrument
+
+# Rounding modes, named after their counterparts in the `decimal` module.
+ROUND_HALF_EVEN = 'half-even'
+ROUND_HALF_UP = 'half-up'
+ROUND_FLOOR = 'floor'
+ROUND_CEILING = 'ceiling'
+ROUND_DOWN = 'down'
+
+ROUNDING_MODES = (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_FLOOR, ROUND_CEILING, ROUND_DOWN)
+
+
+@dataclass
+class Context:
+    """
+    Precision settings for arithmetic, in the manner of `decimal.Context`.
+
+    With `precision` set, every sum, difference, product and quotient is rounded to that many
+    significant digits with the `rounding` mode. Multiplication and division use the limit to
+    skip computing digits that would be discarded. The default context has no limit, so
+    results are exact (quotients keep the whole part only unless a precision is passed).
+
+    Examples:
+        >>> Context(precision=3).apply(bignum("-2.675"))
+        bignum('-2.68')
+        >>> Context(precision=3, rounding=ROUND_DOWN).apply(bignum("-2.675"))
+        bignum('-2.67')
+
+        Settings are checked whenever they are assigned, not only on construction:
+
+        >>> Context().precision = 0
+        Traceback (most recent call last):
+        ...
+        ValueError: Precision must be at least one significant digit
+    """
+    precision: Optional[int] = None
+    rounding: str = ROUND_HALF_EVEN
+
+    def __setattr__(self, name: str, value):
+        if name == 'precision' and value is not None and value < 1:
+            raise ValueError("Precision must be at least one significant digit")
+        if name == 'rounding' and value not in ROUNDING_MODES:
+            raise ValueError(f"Invalid rounding mode: {value}")
+        super().__setattr__(name, value)
+
+    def copy(self) -> Context:
+        return replace(self)
+
+    @property
+    def key(self) -> Optional[Tuple[int, str]]:
+        """The settings that change results, for use in cache keys. None when results are exact."""
+        return None if self.precision is None else (self.precision, self.rounding)
+
+    def apply(self, num):
+        """Round a value to the context precision."""
+        if self.precision is None:
+            return num
+        negative, mantissa, scale = num._parts()
+        if instrument.active is not None:
+            instrument.active.count('context.round')
+        rounded = round_to_precision(negative, mantissa, scale, self.precision, self.rounding)
+        return num if rounded == (mantissa, scale) else bignum._from_parts(negative, *rounded)
+
+
+_current: ContextVar[Context] = ContextVar('bignum_context')
+
+
+def getcontext() -> Context:
+    """
+    Return the context of the current thread or task.
+
+    As with `decimal.getcontext`, each thread starts with its own default context, created on
+    first access, so changing it does not affect other threads.
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> getcontext().precision = 3
+        >>> with ThreadPoolExecutor(1) as pool:
+        ...     pool.submit(lambda: getcontext().precision).result()
+        >>> getcontext().precision = None
+    """
+    try:
+        return _current.get()
+    except LookupError:
+        context = Context()
+        _current.set(context)
+        return context
+
+
+def setcontext(context: Context):
+    """Set the context of the current thread or task."""
+    _current.set(context)
+
+
+@contextmanager
+def localcontext(context: Optional[Context] = None, **settings) -> Iterator[Context]:
+    """
+    Use a copy of `context` (default: the current context), updated with `settings`, within a block.
+
+    Examples:
+        >>> with localcontext(precision=5):
+        ...     bignum("1") / bignum("3")
+        bignum('0.33333')
+    """
+    local = replace(context or getcontext(), **settings)
+    token = _current.set(local)
+    try:
+        yield local
+    finally:
+        _current.reset(token)
+
+
+def _round_up(negative: bool, quotient: int, remainder: int, half: int, rounding: str, sticky: bool) -> bool:
+    """Decide whether dropping `remainder` (plus a nonzero tail if `sticky`) rounds the magnitude up."""
+    if rounding == ROUND_DOWN:
+        return False
+    if rounding in (ROUND_FLOOR, ROUND_CEILING):
+        return (rounding == ROUND_FLOOR) == negative and bool(remainder or sticky)
+    if remainder != half:
+        return remainder > half
+    return rounding == ROUND_HALF_UP or sticky or quotient % 2 == 1
+
+
+def round_parts(negative: bool, mantissa: int, scale: int, places: int, rounding: str, sticky: bool = False) -> Tuple[int, int]:
+    """
+    Round a value to `places` decimal places.
+
+    Args:
+        sticky (bool): Whether the true value has nonzero digits beyond the mantissa. Only
+        meaningful when at least one digit is dropped.
+
+    Returns:
+        Tuple[int, int]: The rounded mantissa and scale.
+
+    Examples:
+        >>> round_parts(False, 2675, 3, 2, ROUND_HALF_EVEN)
+        (268, 2)
+        >>> round_parts(False, 2665, 3, 2, ROUND_HALF_EVEN), round_parts(False, 2665, 3, 2, ROUND_HALF_UP)
+        ((266, 2), (267, 2))
+    """
+    drop = scale - places
+    if drop <= 0:
+        return mantissa, scale
+    quotient, remainder = divmod(mantissa, 10**drop)
+    if _round_up(negative, quotient, remainder, 5 * 10**(drop - 1), rounding, sticky):
+        quotient += 1
+    return quotient, places
+
+
+def round_to_precision(negative: bool, mantissa: int, scale: int, precision: int, rounding: str, sticky: bool = False) -> Tuple[int, int]:
+    """
+    Round a value to `precision` significant digits.
+
+    A carry that adds a digit (9.99 -> 10.0) is absorbed, so the result never has more than
+    `precision` digits.
+
+    Examples:
+        >>> round_to_precision(False, 999, 2, 2, ROUND_HALF_EVEN)
+        (10, 0)
+        >>> round_to_precision(True, 12345, 0, 2, ROUND_FLOOR)
+        (13, -3)
+    """
+    places = scale - (digit_count(mantissa) - precision)
+    mantissa, scale = round_parts(negative, mantissa, scale, places, rounding, sticky)
+    if mantissa == 10**precision:
+        mantissa, scale = mantissa // 10, scale - 1
+    return mantissa, scale
+
+
+from .bignum import bignum
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, Optional
+import threading
+import time
+import tracemalloc
+
+# The instrumentation that hooks report to, or None when instrumentation is off. Hooks read this
+# module attribute and skip all work when it is None, so disabled instrumentation costs one lookup per hook.
+active: Optional[Instrumentation] = None
+
+# Whether `enable` started tracemalloc, so that `disable` knows to stop it.
+_started_tracing = False
+
+
+class Instrumentation:
+    """
+    Counters and phase timers filled in by the operation engines while enabled.
+
+    Counters record events: which algorithm tier each product, square, quotient or modular power
+    went to (``multiply.tier.karatsuba``, ``divide.tier.newton``, ...), bignum allocations
+    (``bignum.allocations``), mantissas padded to a common scale (``bignum.align_scales``),
+    context roundings and carries out of streamed chunks. Timers record the calls and the
+    nanoseconds spent in each phase: the operations themselves (``add.exact``,
+    ``multiply.to_precision``, ...), decimal string parsing (``bignum.parse``), trailing zero
+    removal (``bignum.filtered``) and conversion to decimal digits. Nested phases are included
+    in their parents' times.
+
+    Args:
+        trace_allocations (bool): Also record the bytes allocated by each phase with tracemalloc
+        (default: False). Tracing slows every allocation down, so only use it to compare phases.
+
+    Examples:
+        >>> with instrumented() as stats:
+        ...     stats.count('example.events', 2)
+        ...     with stats.timer('example.phase'):
+        ...         pass
+        >>> snapshot = stats.snapshot()
+        >>> snapshot['counters'], snapshot['timers']['example.phase']['calls']
+        ({'example.events': 2}, 1)
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self.counters: dict[str, int] = {}
+        # name -> [calls, total nanoseconds, longest call in nanoseconds, allocated bytes]
+        self.timers: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: int = 1):
+        """Add `amount` to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, elapsed_ns: int, allocated: int = 0):
+        """Add one call of `elapsed_ns` nanoseconds to a timer."""
+        with self._lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = [0, 0, 0, 0]
+            timer[0] += 1
+            timer[1] += elapsed_ns
+            timer[2] = max(timer[2], elapsed_ns)
+            timer[3] += allocated
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Time the block as one call of the phase `name`."""
+        trace = self.trace_allocations and tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if trace else 0
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            if trace:
+                allocated = max(tracemalloc.get_traced_memory()[0] - allocated, 0)
+            self.record(name, elapsed, allocated)
+
+    def reset(self):
+        """Clear every counter and timer."""
+        with self._lock:
+            self.counters.clear()
+            self.timers.clear()
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters and timers, as plain data that can be serialised to JSON."""
+        with self._lock:
+            timers = {}
+            for name, (calls, total, longest, allocated) in sorted(self.timers.items()):
+                timers[name] = {'calls': calls, 'total_ns': total, 'max_ns': longest}
+                if self.trace_allocations:
+                    timers[name]['allocated_bytes'] = allocated
+            return {'counters': dict(sorted(self.counters.items())), 'timers': timers}
+
+    def to_prometheus(self, prefix: str = 'bignum') -> str:
+        """
+        Render a snapshot in the Prometheus text exposition format, for scraping.
+
+        Examples:
+            >>> stats = Instrumentation()
+            >>> stats.count('multiply.tier.fft')
+            >>> print(stats.to_prometheus())
+            # TYPE bignum_events_total counter
+            bignum_events_total{name="multiply.tier.fft"} 1
+            # TYPE bignum_phase_calls_total counter
+            # TYPE bignum_phase_seconds_total counter
+        """
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {prefix}_events_total counter"]
+        lines += [f'{prefix}_events_total{{name="{name}"}} {value}' for name, value in snapshot['counters'].items()]
+        lines.append(f"# TYPE {prefix}_phase_calls_total counter")
+        lines += [f'{prefix}_phase_calls_total{{phase="{name}"}} {timer["calls"]}' for name, timer in snapshot['timers'].items()]
+        lines.append(f"# TYPE {prefix}_phase_seconds_total counter")
+        lines += [f'{prefix}_phase_seconds_total{{phase="{name}"}} {timer["total_ns"] / 1e9}' for name, timer in snapshot['timers'].items()]
+        if self.trace_allocations:
+            lines.append(f"# TYPE {prefix}_phase_allocated_bytes_total counter")
+            lines += [f'{prefix}_phase_allocated_bytes_total{{phase="{name}"}} {timer["allocated_bytes"]}' for name, timer in snapshot['timers'].items()]
+        return '\n'.join(lines)
+
+
+def enable(instrumentation: Optional[Instrumentation] = None) -> Instrumentation:
+    """Start reporting to `instrumentation` (default: a new one) from every thread, and return it."""
+    global active, _started_tracing
+    active = instrumentation or Instrumentation()
+    if active.trace_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    return active
+
+
+def disable():
+    """
+    Stop reporting, and stop tracemalloc if `enable` started it. The last instrumentation keeps its data.
+
+    Examples:
+        >>> _ = enable(Instrumentation(trace_allocations=True))
+        >>> disable()
+        >>> active is None, tracemalloc.is_tracing()
+        (True, False)
+    """
+    global active, _started_tracing
+    active = None
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+@contextmanager
+def instrumented(instrumentation: Optional[Instrumentation] = None, **settings) -> Iterator[Instrumentation]:
+    """
+    Enable instrumentation within a block, restoring the previous state afterwards.
+
+    Args:
+        settings: Passed to `Instrumentation` when no instrumentation is given.
+    """
+    global active
+    previous = active
+    started_tracing = False
+    current = instrumentation or Instrumentation(**settings)
+    if current.trace_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracing = True
+    active = current
+    try:
+        yield current
+    finally:
+        active = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorate a function to be timed as the phase `name` while instrumentation is enabled.
+    When it is disabled, the only cost is the extra call and one lookup.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = active
+            if stats is None:
+                return func(*args, **kwargs)
+            with stats.timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
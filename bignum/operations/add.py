@@ -1,10 +1,17 @@
-from typing import Tuple, Union
+from typing import Iterable, Iterator, Tuple, Union
+from itertools import zip_longest
 import sys, os
 
 from ..bignum import bignum
+from .. import instrument
+from ..context import getcontext
+from .subtract import Subtract
 
 class Add:
-    chunk_size = 500
+    subtractor = Subtract()
+    
+    # Digits per chunk in `stream_add`. Chunks this size are still cheap to convert with CPython's int().
+    stream_chunk_size = 2000
     
     @staticmethod
     def raw_sum(*nums: Tuple[str]) -> bignum:
@@ -51,85 +58,129 @@ class Add:
     
     def add_two_whole_nums(self, num1: bignum, num2: bignum) -> bignum:
         """Calculate the sum of two whole numbers."""
-        if len(num1) <= self.chunk_size and len(num2) <= self.chunk_size:
-            return bignum(int(num1) + int(num2))
-        
-        # Divide the large input into smaller chunks
-        num1, num2 = sorted([num1, num2], key=len, reverse=True)
-        num1_chunks = list(num1.chunk_whole(Add.chunk_size, reverse=True))
-        num2_chunks = list(num2.chunk_whole(Add.chunk_size, reverse=True))
-
-        result = []
-        carry = 0
-
-        # Loop through the chunks and add the result to the result list
-        for chunk1, chunk2 in zip(num1_chunks, num2_chunks):
-            res, carry = Add.result_and_carry(chunk1, chunk2, carry)
-            result.append(res)
+        return bignum._from_parts(False, int(num1) + int(num2))
+    
+    @staticmethod
+    def _reversed_pieces(chunks: Iterable[Union[str, bytes]], size: int) -> Iterator[str]:
+        """Regroup digit chunks, given least significant first, into pieces of `size` digits from the end."""
+        pending = ''
+        for chunk in chunks:
+            chunk = chunk.decode('ascii') if isinstance(chunk, (bytes, bytearray, memoryview)) else chunk
+            if not chunk.isdecimal():
+                raise ValueError(f"Invalid digit chunk: {chunk[:20]!r}")
+            # Walk the chunk back from its end, so that no piece copies the rest of the chunk.
+            end = len(chunk)
+            if pending:
+                missing = size - len(pending)
+                if end < missing:
+                    pending = chunk + pending
+                    continue
+                yield chunk[end - missing:] + pending
+                end -= missing
+            while end >= size:
+                yield chunk[end - size:end]
+                end -= size
+            pending = chunk[:end]
+        if pending:
+            yield pending
+    
+    def stream_add(self, digits1: Iterable[Union[str, bytes]], digits2: Iterable[Union[str, bytes]]) -> Iterator[str]:
+        """
+        Add two whole numbers given as streams of digit chunks, least significant chunk first.
         
-        # Handle the remaining chunks.
-        del num1_chunks[:len(num2_chunks)]
-        for idx, item in enumerate(num1_chunks):
-            # If there is no carry from the previous operations, 
-            # directly append the remaining chunks to the result list
-            if not carry:
-                result.extend(num1_chunks[idx:])
-                break
-            # Else, evaluate the carry
-            res, carry = Add.result_and_carry(item, carry)
-            result.append(res)
+        The chunks can have any length; within a chunk the digits are in their usual order.
+        The sum is produced the same way, in chunks of `stream_chunk_size` digits, so only 
+        a couple of chunks of each operand are held in memory at any time.
         
+        Examples:
+            >>> list(Add().stream_add(["456", "123"], iter(["99", "9"])))
+            ['124455']
+            >>> adder = Add()
+            >>> adder.stream_chunk_size = 2
+            >>> list(adder.stream_add(["99", "9"], ["1"]))
+            ['00', '0', '1']
+        """
+        size, carry = self.stream_chunk_size, 0
+        pieces = zip_longest(self._reversed_pieces(digits1, size), self._reversed_pieces(digits2, size), fillvalue='')
+        for piece1, piece2 in pieces:
+            width = max(len(piece1), len(piece2))
+            carry, total = divmod(int(piece1 or 0) + int(piece2 or 0) + carry, 10**width)
+            if instrument.active is not None:
+                instrument.active.count('add.stream.chunks')
+                instrument.active.count('add.stream.carries', carry)
+            yield str(total).zfill(width)
         if carry:
-            result.append(carry)
-        
-        # Combine the result list to produce an overall result.
-        result = bignum("".join(reversed(list(map(str, result)))))
-        return result  
+            yield str(carry)
     
+    @instrument.timed('add.exact')
     def add_two_positive_nums(self, num1: bignum, num2: bignum) -> bignum:
         """Calculate the sum of two positive numbers."""
         
-        # Filter out leading and trailing zero's to save computation
-        num1, num2 = num1.filtered(), num2.filtered()
-        
-        # If both are whole numbers, call the function for adding whole numbers directly
-        if not num1.has_decimal() and not num2.has_decimal(include_trailing_zeros=True):
-            return self.add_two_whole_nums(num1, num2).filtered()
-        
-        # Else, convert the decimals into whole numbers by removing the decimal point.
-        num1_whole, num2_whole = num1.get_whole(), num2.get_whole()
-        num1_dec, num2_dec = bignum.equalize_decimals(num1, num2, decimal_only=True)
-        
-        num1_combined = bignum(f"{num1_whole}{num1_dec}")
-        num2_combined = bignum(f"{num2_whole}{num2_dec}")
-        decimal_len = len(num1_dec)
-        
-        # Compute the result and add the decimal point back.
-        return self.add_two_whole_nums(num1_combined, num2_combined).shift_decimals_left(decimal_len)
+        # Bring both mantissas to a common scale so that the digits line up, then add them.
+        mantissa1, mantissa2, scale = bignum._align_scales(num1, num2)
+        return bignum._from_parts(False, mantissa1 + mantissa2, scale).filtered()
     
     def add_two_nums(self, num1: bignum, num2: bignum) -> bignum:
-        """Calculate the sum of two numbers."""
+        """Calculate the sum of two numbers, rounded to the precision of the current context."""
         
         # If any number is negative, switch to subtraction. 
         # Else, call the function for adding positive numbers.
         num1_positive, num2_positive = num1.is_positive(), num2.is_positive()
         if num1_positive and num2_positive:
-            return self.add_two_positive_nums(num1, num2)
-        if num1_positive:
-            # return sub.sub(num1, num2.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        if num2_positive:
-            # return sub.sub(num2, num1.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        return bignum(f"-{self.add_two_positive_nums(num1.to_positive(), num2.to_positive())}")
+            result = self.add_two_positive_nums(num1, num2)
+        elif num1_positive:
+            result = self.subtractor.subtract_two_positive_nums(num1, num2.to_positive())
+        elif num2_positive:
+            result = self.subtractor.subtract_two_positive_nums(num2, num1.to_positive())
+        else:
+            result = self.add_two_positive_nums(num1.to_positive(), num2.to_positive()).to_negative()
+        return getcontext().apply(result)
+    
+    @instrument.timed('add.sum')
+    def sum_positive_nums(self, *nums: bignum) -> bignum:
+        """
+        Calculate the sum of any number of positive numbers in a single pass.
+        
+        Operands are grouped by scale and the mantissas of each group are summed as they are.
+        Each group total is then aligned to the common scale once, so no operand is padded
+        and no intermediate result is normalised.
+        
+        Examples:
+            >>> Add().sum_positive_nums(bignum("1.25"), bignum("3"), bignum("0.75"), bignum("10.5"))
+            bignum('15.5')
+        """
+        groups = {}
+        for num in nums:
+            _, mantissa, scale = num._parts()
+            groups[scale] = groups.get(scale, 0) + mantissa
+        if not groups:
+            return bignum._from_parts(False, 0)
+        scale = max(groups)
+        total = sum(mantissa * 10**(scale - group_scale) for group_scale, mantissa in groups.items())
+        return bignum._from_parts(False, total, scale).filtered()
     
     def add(self, *args) -> bignum:
-        """Calculate the sum of the given numbers."""
+        """
+        Calculate the sum of the given numbers.
+        
+        Operands of each sign are summed in a single pass with `sum_positive_nums`, 
+        and the two totals are combined at the end.
+        
+        Examples:
+            >>> Add().add("005.50")
+            bignum('5.5')
+        """
         if not args: 
             return bignum('0')
-        final_result = bignum(args[0])
-        for item in args[1:]:
-            final_result = self.add_two_nums(final_result, bignum(item))
-        return final_result
+        nums = [arg if isinstance(arg, bignum) else bignum(arg) for arg in args]
+        if len(nums) == 1:
+            return getcontext().apply(nums[0].filtered())
+        positives = [num for num in nums if num.is_positive()]
+        negatives = [num.to_positive() for num in nums if num.is_negative()]
+        if not negatives:
+            return getcontext().apply(self.sum_positive_nums(*positives))
+        if not positives:
+            return getcontext().apply(self.sum_positive_nums(*negatives).to_negative())
+        return self.add_two_nums(self.sum_positive_nums(*positives), self.sum_positive_nums(*negatives).to_negative())
 
 add = Add().add
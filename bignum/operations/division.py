@@ -1,8 +1,24 @@
-from typing import Tuple, Union
-from ..bignum import bignum  
+from typing import Tuple, Union, Optional
+from ..bignum import bignum, _LOG10_2
+from .. import instrument
+from ..cache import ResultCache
+from ..context import Context, getcontext, round_to_precision
+from .multiply import Multiply
 
 class Divide:
-    chunk_size = 500
+    # Crossover points between the division algorithms, in decimal digits of the smaller of 
+    # the divisor and the quotient. Below `burnikel_ziegler_threshold`, CPython's built-in 
+    # division is used; from `newton_threshold`, division goes through a Newton reciprocal.
+    burnikel_ziegler_threshold = 2000
+    newton_threshold = 20000
+    
+    # Extra bits carried by the Newton reciprocal beyond the requested precision.
+    _guard_bits = 32
+    
+    multiplier = Multiply()
+    
+    # Optional memo of results, shared by every instance. See `bignum.cache.ResultCache`.
+    cache: Optional[ResultCache] = None
     
     @staticmethod
     def raw_quotient(dividend: str, divisor: str) -> bignum:
@@ -11,76 +27,272 @@ class Divide:
 
         Examples:
             >>> Divide.raw_quotient("090", "10")
-            bignum('09')
+            bignum('9')
             >>> Divide.raw_quotient("435", "29")
             bignum('15')
             >>> Divide.raw_quotient("15", "3")
             bignum('5')
         """
-        return bignum(str(eval(dividend) // eval(divisor)))
+        return bignum._from_parts(False, int(bignum(dividend)) // int(bignum(divisor)))
+    
+    def divmod_mantissas(self, dividend: int, divisor: int) -> Tuple[int, int]:
+        """
+        Calculate the quotient and remainder of two non-negative integers, choosing the algorithm by operand size.
+        
+        Examples:
+            >>> Divide().divmod_mantissas(83810206, 6789)
+            (12345, 1)
+        """
+        if not divisor:
+            raise ValueError("Division by zero")
+        divisor_bits = divisor.bit_length()
+        quotient_bits = dividend.bit_length() - divisor_bits + 1
+        if quotient_bits <= 0:
+            return 0, dividend
+        digits = min(divisor_bits, quotient_bits) * _LOG10_2
+        stats = instrument.active
+        if digits < self.burnikel_ziegler_threshold:
+            if stats is not None: stats.count('divide.tier.native')
+            return divmod(dividend, divisor)
+        if digits < self.newton_threshold:
+            if stats is not None: stats.count('divide.tier.burnikel_ziegler')
+            return self.burnikel_ziegler_divmod(dividend, divisor)
+        if stats is not None: stats.count('divide.tier.newton')
+        return self.newton_divmod(dividend, divisor)
+    
+    def burnikel_ziegler_divmod(self, dividend: int, divisor: int) -> Tuple[int, int]:
+        """
+        Divide with the recursive method of Burnikel and Ziegler.
+        
+        The dividend is cut into blocks the size of the divisor, and each two-block by one-block 
+        division is split into two three-half by two-half divisions, which recurse back into 
+        two-block by one-block divisions of half the size. The partial products go through the 
+        multiplication engine.
+        
+        Examples:
+            >>> Divide().burnikel_ziegler_divmod(10**50 + 7, 12345678901234567)
+            (8100000072900001247400016548300239, 12282757518838494)
+        """
+        block_bits = divisor.bit_length()
+        blocks = self._split_blocks(dividend, block_bits)
+        quotient_blocks = []
+        remainder = 0
+        for block in reversed(blocks):
+            quotient_block, remainder = self._divide_2n_by_1n((remainder << block_bits) | block, divisor, block_bits)
+            quotient_blocks.append(quotient_block)
+        quotient = 0
+        for quotient_block in quotient_blocks:
+            quotient = (quotient << block_bits) | quotient_block
+        return quotient, remainder
+    
+    @staticmethod
+    def _split_blocks(value: int, block_bits: int) -> list[int]:
+        """Split a non-negative integer into blocks of `block_bits` bits, least significant first."""
+        blocks = [0] * max((value.bit_length() + block_bits - 1) // block_bits, 1)
+        
+        def split(part: int, low: int, high: int):
+            if high - low == 1:
+                blocks[low] = part
+                return
+            middle = (low + high) // 2
+            shift = (middle - low) * block_bits
+            upper = part >> shift
+            split(part - (upper << shift), low, middle)
+            split(upper, middle, high)
+        
+        split(value, 0, len(blocks))
+        return blocks
+    
+    def _divide_2n_by_1n(self, dividend: int, divisor: int, bits: int) -> Tuple[int, int]:
+        """Divide `dividend` < 2**bits * `divisor` by a `divisor` of exactly `bits` bits."""
+        if bits * _LOG10_2 < self.burnikel_ziegler_threshold:
+            return divmod(dividend, divisor)
+        odd = bits & 1
+        if odd:
+            dividend, divisor, bits = dividend << 1, divisor << 1, bits + 1
+        half = bits >> 1
+        mask = (1 << half) - 1
+        divisor_high, divisor_low = divisor >> half, divisor & mask
+        quotient_high, remainder = self._divide_3h_by_2h(dividend >> bits, (dividend >> half) & mask, divisor, divisor_high, divisor_low, half)
+        quotient_low, remainder = self._divide_3h_by_2h(remainder, dividend & mask, divisor, divisor_high, divisor_low, half)
+        if odd:
+            remainder >>= 1
+        return (quotient_high << half) | quotient_low, remainder
+    
+    def _divide_3h_by_2h(self, dividend_high: int, dividend_low: int, divisor: int, divisor_high: int, divisor_low: int, half: int) -> Tuple[int, int]:
+        """Divide the three half-blocks `dividend_high`, `dividend_low` by the two half-blocks `divisor_high`, `divisor_low`."""
+        if dividend_high >> half == divisor_high:
+            quotient, remainder = (1 << half) - 1, dividend_high - (divisor_high << half) + divisor_high
+        else:
+            quotient, remainder = self._divide_2n_by_1n(dividend_high, divisor_high, half)
+        remainder = ((remainder << half) | dividend_low) - self.multiplier.multiply_mantissas(quotient, divisor_low)
+        while remainder < 0:
+            quotient -= 1
+            remainder += divisor
+        return quotient, remainder
+    
+    def reciprocal(self, divisor: int, precision: int) -> int:
+        """
+        Approximate 2**(divisor.bit_length() + precision) / divisor with Newton's iteration.
+        
+        Each step x + x*(1 - divisor*x) doubles the number of correct bits, so the iteration 
+        starts from a native division at low precision and doubles the working precision 
+        on every step. Each step only uses as many leading bits of the divisor as its precision needs.
+        The result is accurate to a few units in the last place.
+        
+        Examples:
+            >>> Divide().reciprocal(3, 10)
+            1365
+        """
+        divisor_bits = divisor.bit_length()
+        guard = self._guard_bits
+        
+        # The precision of every step, from the final one down to one small enough for native division.
+        steps = []
+        while precision > 4 * guard:
+            steps.append(precision)
+            precision = precision // 2 + guard
+        
+        truncated = divisor >> max(divisor_bits - precision - guard, 0)
+        result = (1 << (truncated.bit_length() + precision)) // truncated
+        for step in reversed(steps):
+            result <<= step - precision
+            truncated = divisor >> max(divisor_bits - step - guard, 0)
+            scale = step + truncated.bit_length()
+            error = (1 << scale) - self.multiplier.multiply_mantissas(truncated, result)
+            result += self.multiplier._signed_multiply(result, error) >> scale
+            precision = step
+        return result
+    
+    def newton_divmod(self, dividend: int, divisor: int) -> Tuple[int, int]:
+        """
+        Divide by multiplying with a Newton reciprocal of the divisor, then correcting the remainder.
+        
+        Examples:
+            >>> Divide().newton_divmod(10**50 + 7, 12345678901234567)
+            (8100000072900001247400016548300239, 12282757518838494)
+        """
+        if dividend < divisor:
+            return 0, dividend
+        precision = dividend.bit_length() - divisor.bit_length() + 1 + self._guard_bits
+        return self.divmod_by_reciprocal(dividend, divisor, self.reciprocal(divisor, precision), precision)
+    
+    def divmod_by_reciprocal(self, dividend: int, divisor: int, inverse: int, precision: int) -> Tuple[int, int]:
+        """
+        Divide with a reciprocal obtained from `reciprocal(divisor, precision)`, then correct the remainder.
+        
+        The same reciprocal can be reused for every dividend whose quotient has fewer than 
+        about `precision` bits, which saves the Newton iteration when dividing repeatedly by one divisor.
+        """
+        divisor_bits = divisor.bit_length()
+        
+        # Only the leading bits of the dividend contribute to the quotient estimate.
+        shift = max(divisor_bits - precision, 0)
+        quotient = self.multiplier.multiply_mantissas(dividend >> shift, inverse) >> (divisor_bits + precision - shift)
+        remainder = dividend - self.multiplier.multiply_mantissas(quotient, divisor)
+        
+        # The estimate is off by at most a few units, so this division is cheap.
+        correction, remainder = divmod(remainder, divisor)
+        return quotient + correction, remainder
     
     def divide_two_whole_nums(self, num1: bignum, num2: bignum) -> bignum:
         """Calculate the quotient of dividing two whole numbers."""
-        if int(num2) == 0:
+        return bignum._from_parts(False, self.divmod_mantissas(int(num1), int(num2))[0])
+    
+    @instrument.timed('divide.exact')
+    def divide_two_positive_nums(self, num1: bignum, num2: bignum, precision: Optional[int] = None) -> bignum:
+        """
+        Calculate the quotient of dividing two positive numbers.
+        
+        Args:
+            precision (int): The number of decimal places to keep. Digits beyond it are truncated (default: None, whole quotient).
+        """
+        
+        # Scaling both operands by the same power of ten leaves the quotient unchanged,
+        # so the aligned mantissas can be divided directly. Scaling the dividend by
+        # 10**precision gives the quotient that many decimal places.
+        mantissa1, mantissa2, _ = bignum._align_scales(num1, num2)
+        precision = max(precision or 0, 0)
+        quotient, _ = self.divmod_mantissas(mantissa1 * 10**precision, mantissa2)
+        return bignum._from_parts(False, quotient, precision).filtered()
+    
+    @instrument.timed('divide.to_precision')
+    def divide_to_precision(self, num1: bignum, num2: bignum, context: Context) -> bignum:
+        """
+        Calculate the quotient of dividing two numbers, rounded to `context.precision` significant digits.
+        
+        The division stops after `precision + 1` digits of the quotient. Whether the remainder 
+        is zero tells whether any nonzero digits follow, which is all the rounding needs to know 
+        about the rest of the quotient.
+        
+        Examples:
+            >>> Divide().divide_to_precision(bignum("2"), bignum("-3"), Context(precision=4))
+            bignum('-0.6667')
+            >>> Divide().divide_to_precision(bignum("0"), bignum("0"), Context(precision=4))
+            Traceback (most recent call last):
+            ...
+            ValueError: Division by zero
+        """
+        _, mantissa1, scale1 = num1._parts()
+        _, mantissa2, scale2 = num2._parts()
+        if not mantissa2:
             raise ValueError("Division by zero")
-        if len(num1) <= self.chunk_size and len(num2) <= self.chunk_size:
-            return bignum(int(num1) // int(num2))
+        if not mantissa1:
+            return bignum._from_parts(False, 0)
+        negative = num1.is_negative() != num2.is_negative()
         
-        # Divide the large input into smaller chunks
-        num1, num2 = sorted([num1, num2], key=len, reverse=True)
-        num1_chunks = list(num1.chunk_whole(Divide.chunk_size, reverse=True))
-        num2_chunks = list(num2.chunk_whole(Divide.chunk_size, reverse=True))
-
-        result = bignum('0')
-
-        # Loop through the chunks and add the result to the result list
-        for idx, chunk1 in enumerate(num1_chunks):
-            for _ in range(idx):
-                chunk1 += '0'  # Shift left based on the position in the original number
-            chunk_result = '0'
-            while chunk1 >= num2:
-                chunk1 -= num2
-                chunk_result = str(int(chunk_result) + 1)
-            result = result + chunk_result
+        # mantissa1 has at least the lower and mantissa2 at most the upper digit count estimated 
+        # from their bit lengths, so this shift gives the quotient at least precision + 1 digits.
+        shift = context.precision + 1 + int(mantissa2.bit_length() * _LOG10_2) - int((mantissa1.bit_length() - 1) * _LOG10_2)
+        if shift >= 0:
+            quotient, remainder = self.divmod_mantissas(mantissa1 * 10**shift, mantissa2)
+        else:
+            quotient, remainder = self.divmod_mantissas(mantissa1, mantissa2 * 10**-shift)
+        rounded = round_to_precision(negative, quotient, scale1 - scale2 + shift, context.precision, context.rounding, sticky=bool(remainder))
+        return bignum._from_parts(negative, *rounded).filtered()
+    
+    def divide_two_nums(self, num1: bignum, num2: bignum, precision: Optional[int] = None, use_cache=True) -> bignum:
+        """
+        Calculate the quotient of dividing two numbers. Results are memoised when `cache` is set and `use_cache` is True.
         
-        return result
+        Args:
+            precision (int): The number of decimal places to keep, truncating the rest (default: None). 
+            When None, the quotient is rounded to the precision of the current context, or 
+            truncated to its whole part if the context has no precision.
+        """
+        context = getcontext()
+        if use_cache and self.cache is not None:
+            key = self.cache.key('/', num1, num2, extra=(precision, context.key))
+            result = self.cache.get(key)
+            if result is None:
+                result = self.divide_two_nums(num1, num2, precision, use_cache=False)
+                self.cache.put(key, result)
+            return result
+        
+        if precision is None and context.precision is not None:
+            return self.divide_to_precision(num1, num2, context)
+        
+        # The magnitude of the result only depends on the magnitudes of the operands;
+        # the result is negative when exactly one of the operands is.
+        result = self.divide_two_positive_nums(num1.to_positive(), num2.to_positive(), precision)
+        return result.negate() if num1.is_negative() != num2.is_negative() else result
     
-    def divide_two_positive_nums(self, num1: bignum, num2: bignum) -> bignum:
-        """Calculate the quotient of dividing two positive numbers."""
-        
-        # If both are whole numbers, call the function for dividing whole numbers directly
-        if not num1.has_decimal() and not num2.has_decimal(include_trailing_zeros=True):
-            return self.divide_two_whole_nums(num1, num2).filtered()
-        
-        # Else, convert the decimals into whole numbers by removing the decimal point.
-        num1_whole, num2_whole = num1.get_whole(), num2.get_whole()
-        num1_dec, num2_dec = bignum.equalize_decimals(num1, num2, decimal_only=True)
-        
-        num1_combined = bignum(f"{num1_whole}{num1_dec}")
-        num2_combined = bignum(f"{num2_whole}{num2_dec}")
-        decimal_len = len(num1_dec)
-        
-        # Compute the result and add the decimal point back.
-        return self.divide_two_whole_nums(num1_combined, num2_combined).shift_decimals_left(decimal_len)
-    
-    def divide_two_nums(self, num1: bignum, num2: bignum) -> bignum:
-        """Calculate the quotient of dividing two numbers."""
-        
-        # If any number is negative, switch to negative division. 
-        # Else, call the function for dividing positive numbers.
-        num1_positive, num2_positive = num1.is_positive(), num2.is_positive()
-        if num1_positive and num2_positive:
-            return self.divide_two_positive_nums(num1, num2)
-        if num1_positive:
-            # return divide.neg_divide(num1, num2.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        if num2_positive:
-            # return divide.neg_divide(num2, num1.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        return bignum(self.divide_two_positive_nums(num1.to_positive(), num2.to_positive())).negate()
-    
-    def divide(self, dividend: Union[str, bignum], divisor: Union[str, bignum]) -> bignum:
-        """Calculate the quotient of dividing the dividend by the divisor."""
+    def divide(self, dividend: Union[str, bignum], divisor: Union[str, bignum], precision: Optional[int] = None) -> bignum:
+        """
+        Calculate the quotient of dividing the dividend by the divisor.
+        
+        Args:
+            precision (int): The number of decimal places to keep. Digits beyond it are truncated (default: None, whole 
+            quotient, or the precision of the current context if it has one).
+            
+        Examples:
+            >>> Divide().divide("10", "4")
+            bignum('2')
+            >>> Divide().divide("10", "4", precision=3)
+            bignum('2.5')
+            >>> Divide().divide("1", "7", precision=10)
+            bignum('0.1428571428')
+        """
         dividend, divisor = bignum(dividend), bignum(divisor)
         if divisor == 0:
             raise ValueError("Division by zero")
@@ -88,10 +300,7 @@ class Divide:
         if not dividend:
             return bignum('0')
         
-        if divisor == 1:
-            return dividend
-        
-        return self.divide_two_nums(dividend, divisor)
+        return self.divide_two_nums(dividend, divisor, precision)
 
 divide = Divide().divide
 
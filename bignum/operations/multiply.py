@@ -1,8 +1,38 @@
-from typing import Tuple, Union
-from ..bignum import bignum  
+from typing import Tuple, Union, Optional, Callable
+import gmpy2
+
+from ..bignum import bignum, _LOG10_2
+from .. import instrument
+from ..cache import ResultCache
+from ..context import Context, getcontext, round_to_precision
+from . import parallel
 
 class Multiply:
-    chunk_size = 500
+    """
+    Multiplication engine that picks an algorithm by operand size.
+    
+    With the default thresholds, products below `fft_threshold` use CPython's built-in
+    multiplication and larger ones go to the gmpy2 (GMP) tier. The pure Python Karatsuba,
+    Toom-3 and unbalanced tiers are therefore never selected by default: they are fallbacks,
+    reached only when `fft_threshold` is set to None or raised above `karatsuba_threshold`.
+    """
+    # Crossover points between the multiplication algorithms, in decimal digits of the smaller operand.
+    # Below `karatsuba_threshold`, CPython's built-in multiplication is used. 
+    # The FFT tier takes precedence over the pure Python tiers; set `fft_threshold` to None to disable it.
+    karatsuba_threshold = 2000
+    toom3_threshold = 20000
+    fft_threshold: Optional[int] = 1000
+    
+    # Opt-in parallel mode: products whose smaller operand has at least `parallel_threshold` digits
+    # are split into independent sub-products that run on a pool of `workers` processes.
+    workers: Optional[int] = None
+    parallel_threshold = 200000
+    
+    # Optional memo of results, shared by every instance. See `bignum.cache.ResultCache`.
+    cache: Optional[ResultCache] = None
+    
+    # Digits kept beyond the context precision when operands are truncated before multiplying.
+    guard_digits = 3
     
     @staticmethod
     def raw_product(*nums: Tuple[str]) -> bignum:
@@ -47,63 +77,292 @@ class Multiply:
             return result[1:], int(result[0])
         return result, 0
     
-    def multiply_two_whole_nums(self, num1: bignum, num2: bignum) -> bignum:
-        """Calculate the product of two whole numbers."""
-        if len(num1) <= self.chunk_size and len(num2) <= self.chunk_size:
-            return bignum(int(num1) * int(num2))
+    def multiply_mantissas(self, mantissa1: int, mantissa2: int) -> int:
+        """
+        Calculate the product of two non-negative integers, choosing the algorithm by operand size.
         
-        # Divide the large input into smaller chunks
-        num1, num2 = sorted([num1, num2], key=len, reverse=True)
-        num1_chunks = list(num1.chunk_whole(Multiply.chunk_size, reverse=True))
-        num2_chunks = list(num2.chunk_whole(Multiply.chunk_size, reverse=True))
-
-        result = bignum('0')
-
-        # Loop through the chunks and add the result to the result list
-        for idx, chunk1 in enumerate(num1_chunks):
-            for _ in range(idx):
-                chunk1 += '0'  # Shift left based on the position in the original number
-            for idx2, chunk2 in enumerate(num2_chunks):
-                for _ in range(idx2):
-                    chunk2 += '0'  # Shift left based on the position in the original number
-                res, _ = Multiply.result_and_carry(chunk1, chunk2)
-                result = result + res
+        Examples:
+            >>> Multiply().multiply_mantissas(12345, 6789)
+            83810205
+        """
+        small, large = sorted((mantissa1.bit_length(), mantissa2.bit_length()))
+        digits = small * _LOG10_2
+        stats = instrument.active
+        if self.workers and self.workers > 1 and digits >= self.parallel_threshold:
+            if stats is not None: stats.count('multiply.tier.parallel')
+            return self.parallel_multiply(mantissa1, mantissa2)
+        if digits < self.karatsuba_threshold and (self.fft_threshold is None or digits < self.fft_threshold):
+            if stats is not None: stats.count('multiply.tier.native')
+            return mantissa1 * mantissa2
+        if self.fft_threshold is not None and digits >= self.fft_threshold:
+            if stats is not None: stats.count('multiply.tier.fft')
+            return self.fft_multiply(mantissa1, mantissa2)
+        if large > 2 * small:
+            if stats is not None: stats.count('multiply.tier.unbalanced')
+            return self.unbalanced_multiply(mantissa1, mantissa2)
+        if digits >= self.toom3_threshold:
+            if stats is not None: stats.count('multiply.tier.toom3')
+            return self.toom3_multiply(mantissa1, mantissa2)
+        if stats is not None: stats.count('multiply.tier.karatsuba')
+        return self.karatsuba_multiply(mantissa1, mantissa2)
+    
+    def square_mantissa(self, mantissa: int) -> int:
+        """
+        Calculate the square of a non-negative integer, choosing the algorithm by operand size.
         
+        A square needs fewer partial products than a general product: CPython and GMP both 
+        have dedicated squaring code, and Karatsuba's split takes three half-size squares.
+        
+        Examples:
+            >>> Multiply().square_mantissa(12345)
+            152399025
+        """
+        digits = mantissa.bit_length() * _LOG10_2
+        stats = instrument.active
+        if self.workers and self.workers > 1 and digits >= self.parallel_threshold:
+            if stats is not None: stats.count('square.tier.parallel')
+            return self.parallel_multiply(mantissa, mantissa)
+        if digits < self.karatsuba_threshold and (self.fft_threshold is None or digits < self.fft_threshold):
+            if stats is not None: stats.count('square.tier.native')
+            # CPython switches to its squaring routine when both operands are the same object.
+            return mantissa * mantissa
+        if self.fft_threshold is not None and digits >= self.fft_threshold:
+            if stats is not None: stats.count('square.tier.fft')
+            return int(gmpy2.square(gmpy2.mpz(mantissa)))
+        if stats is not None: stats.count('square.tier.karatsuba')
+        return self.karatsuba_square(mantissa)
+    
+    def karatsuba_square(self, mantissa: int) -> int:
+        """
+        Square an integer with Karatsuba's method. Also used in place of Toom-3 squaring, 
+        since the three half-size squares already share every operand.
+        
+        Examples:
+            >>> Multiply().karatsuba_square(123456789)
+            15241578750190521
+        """
+        half = mantissa.bit_length() // 2
+        high, low = mantissa >> half, mantissa & ((1 << half) - 1)
+        low_square, high_square = self.square_mantissa(low), self.square_mantissa(high)
+        middle = self.square_mantissa(low + high) - low_square - high_square
+        return (high_square << (2 * half)) + (middle << half) + low_square
+    
+    def _signed_multiply(self, num1: int, num2: int) -> int:
+        """Multiply two integers of any sign through `multiply_mantissas`."""
+        product = self.multiply_mantissas(abs(num1), abs(num2))
+        return -product if (num1 < 0) != (num2 < 0) else product
+    
+    def unbalanced_multiply(self, mantissa1: int, mantissa2: int) -> int:
+        """
+        Multiply operands of very different sizes by splitting the larger one into pieces 
+        the size of the smaller one, so that every partial product is balanced.
+        """
+        if mantissa1.bit_length() < mantissa2.bit_length():
+            mantissa1, mantissa2 = mantissa2, mantissa1
+        piece_bits = mantissa2.bit_length()
+        mask = (1 << piece_bits) - 1
+        result, shift = 0, 0
+        while mantissa1:
+            result += self.multiply_mantissas(mantissa1 & mask, mantissa2) << shift
+            mantissa1 >>= piece_bits
+            shift += piece_bits
         return result
     
+    def karatsuba_multiply(self, mantissa1: int, mantissa2: int) -> int:
+        """
+        Multiply two integers with Karatsuba's method: three half-size products instead of four.
+        
+        Examples:
+            >>> Multiply().karatsuba_multiply(12345, 6789)
+            83810205
+        """
+        half = max(mantissa1.bit_length(), mantissa2.bit_length()) // 2
+        mask = (1 << half) - 1
+        high1, low1 = mantissa1 >> half, mantissa1 & mask
+        high2, low2 = mantissa2 >> half, mantissa2 & mask
+        
+        low = self.multiply_mantissas(low1, low2)
+        high = self.multiply_mantissas(high1, high2)
+        middle = self.multiply_mantissas(low1 + high1, low2 + high2) - low - high
+        return (high << (2 * half)) + (middle << half) + low
+    
+    def toom3_multiply(self, mantissa1: int, mantissa2: int) -> int:
+        """
+        Multiply two integers with the Toom-Cook 3-way method: five third-size products instead of nine.
+        
+        Both operands are split into three parts and treated as polynomials, which are evaluated 
+        at 0, 1, -1, -2 and infinity, multiplied pointwise and interpolated back (Bodrato's sequence).
+        
+        Examples:
+            >>> Multiply().toom3_multiply(123456789, 987654321)
+            121932631112635269
+        """
+        part = (max(mantissa1.bit_length(), mantissa2.bit_length()) + 2) // 3
+        mask = (1 << part) - 1
+        x0, x1, x2 = mantissa1 & mask, (mantissa1 >> part) & mask, mantissa1 >> (2 * part)
+        y0, y1, y2 = mantissa2 & mask, (mantissa2 >> part) & mask, mantissa2 >> (2 * part)
+        
+        # Evaluation
+        x_sum, y_sum = x0 + x2, y0 + y2
+        r0 = self.multiply_mantissas(x0, y0)
+        r1 = self.multiply_mantissas(x_sum + x1, y_sum + y1)
+        r_neg1 = self._signed_multiply(x_sum - x1, y_sum - y1)
+        r_neg2 = self._signed_multiply(x0 - 2*x1 + 4*x2, y0 - 2*y1 + 4*y2)
+        r_inf = self.multiply_mantissas(x2, y2)
+        
+        # Interpolation. Every division here is exact.
+        r3 = (r_neg2 - r1) // 3
+        r1 = (r1 - r_neg1) >> 1
+        r2 = r_neg1 - r0
+        r3 = ((r2 - r3) >> 1) + 2*r_inf
+        r2 = r2 + r1 - r_inf
+        r1 = r1 - r3
+        return r0 + (r1 << part) + (r2 << (2 * part)) + (r3 << (3 * part)) + (r_inf << (4 * part))
+    
+    def parallel_multiply(self, mantissa1: int, mantissa2: int) -> int:
+        """
+        Multiply two integers on a pool of worker processes.
+        
+        The product is split with Karatsuba's method, and unbalanced operands into balanced pieces, 
+        until there are at least as many independent sub-products as workers. Each sub-product is 
+        shipped to a worker as a pair of little-endian byte buffers and the results are recombined here.
+        """
+        executor = parallel.get_executor(self.workers)
+        thresholds = (self.karatsuba_threshold, self.toom3_threshold, self.fft_threshold)
+        
+        def plan(num1: int, num2: int, tasks: int) -> Callable[[], int]:
+            """Submit the sub-products of num1 * num2, split into about `tasks` pieces, and return a function that combines them."""
+            small, large = sorted((num1.bit_length(), num2.bit_length()))
+            if tasks <= 1 or small * _LOG10_2 < self.karatsuba_threshold:
+                future = executor.submit(parallel.multiply_buffers, parallel.to_bytes(num1), parallel.to_bytes(num2), thresholds)
+                return lambda: parallel.from_bytes(future.result())
+            
+            if large > 2 * small:
+                if num1.bit_length() < num2.bit_length():
+                    num1, num2 = num2, num1
+                mask = (1 << small) - 1
+                pieces = [((num1 >> shift) & mask, shift) for shift in range(0, large, small)]
+                parts = [(plan(piece, num2, -(-tasks // len(pieces))), shift) for piece, shift in pieces]
+                return lambda: sum(part() << shift for part, shift in parts)
+            
+            half = large // 2
+            mask = (1 << half) - 1
+            high1, low1 = num1 >> half, num1 & mask
+            high2, low2 = num2 >> half, num2 & mask
+            subtasks = -(-tasks // 3)
+            low, high = plan(low1, low2, subtasks), plan(high1, high2, subtasks)
+            middle = plan(low1 + high1, low2 + high2, subtasks)
+            
+            def combine() -> int:
+                low_product, high_product = low(), high()
+                middle_product = middle() - low_product - high_product
+                return (high_product << (2 * half)) + (middle_product << half) + low_product
+            return combine
+        
+        return plan(mantissa1, mantissa2, self.workers)()
+    
+    @staticmethod
+    def fft_multiply(mantissa1: int, mantissa2: int) -> int:
+        """
+        Multiply two integers with GMP, which moves on to Schönhage-Strassen FFT multiplication 
+        for operands of many thousands of digits.
+        """
+        return int(gmpy2.mpz(mantissa1) * gmpy2.mpz(mantissa2))
+    
+    def multiply_two_whole_nums(self, num1: bignum, num2: bignum) -> bignum:
+        """Calculate the product of two whole numbers."""
+        return bignum._from_parts(False, self.multiply_mantissas(int(num1), int(num2)))
+    
+    @instrument.timed('multiply.exact')
     def multiply_two_positive_nums(self, num1: bignum, num2: bignum) -> bignum:
         """Calculate the product of two positive numbers."""
         
-        # If both are whole numbers, call the function for multiplying whole numbers directly
-        if not num1.has_decimal() and not num2.has_decimal(include_trailing_zeros=True):
-            return self.multiply_two_whole_nums(num1, num2).filtered()
-        
-        # Else, convert the decimals into whole numbers by removing the decimal point.
-        num1_whole, num2_whole = num1.get_whole(), num2.get_whole()
-        num1_dec, num2_dec = bignum.equalize_decimals(num1, num2, decimal_only=True)
-        
-        num1_combined = bignum(f"{num1_whole}{num1_dec}")
-        num2_combined = bignum(f"{num2_whole}{num2_dec}")
-        decimal_len = len(num1_dec)
-        
-        # Compute the result and add the decimal point back.
-        return self.multiply_two_whole_nums(num1_combined, num2_combined).shift_decimals_left(decimal_len)
-    
-    def multiply_two_nums(self, num1: bignum, num2: bignum) -> bignum:
-        """Calculate the product of two numbers."""
-        
-        # If any number is negative, switch to negative multiplication. 
-        # Else, call the function for multiplying positive numbers.
-        num1_positive, num2_positive = num1.is_positive(), num2.is_positive()
-        if num1_positive and num2_positive:
-            return self.multiply_two_positive_nums(num1, num2)
-        if num1_positive:
-            # return multiply.neg_multiply(num1, num2.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        if num2_positive:
-            # return multiply.neg_multiply(num2, num1.to_positive())
-            raise ValueError("Negative numbers are not supported yet.")
-        return bignum(self.multiply_two_positive_nums(num1.to_positive(), num2.to_positive())).negate()
+        # The product of the mantissas carries the digits of both decimal parts.
+        _, mantissa1, scale1 = num1._parts()
+        _, mantissa2, scale2 = num2._parts()
+        return bignum._from_parts(False, self.multiply_mantissas(mantissa1, mantissa2), scale1 + scale2).filtered()
+    
+    @staticmethod
+    def _product_bounds(mantissa1: int, cut1: int, mantissa2: int, cut2: int, digits: int) -> Tuple[int, int]:
+        """
+        Bound mantissa1 * mantissa2 / 10**(cut1 + cut2) between two integers, looking only at the 
+        leading `digits` digits of each operand.
+        
+        Each operand is reduced to a binary floating-point number of slightly more than `digits` 
+        digits with gmpy2.mpfr, rounding down for the lower bound and up for the upper bound, 
+        so the bounds are exact while costing only a short product.
+        """
+        bits = int(digits / _LOG10_2) + 64
+        exponents = dict(emax=gmpy2.get_emax_max(), emin=gmpy2.get_emin_min())
+        bounds = []
+        for rounding, inward in ((gmpy2.RoundDown, gmpy2.RoundUp), (gmpy2.RoundUp, gmpy2.RoundDown)):
+            upper = rounding == gmpy2.RoundUp
+            factors = []
+            for mantissa, cut in ((mantissa1, cut1), (mantissa2, cut2)):
+                if not cut:
+                    factors.append(gmpy2.mpz(mantissa))
+                    continue
+                shift = max(mantissa.bit_length() - bits, 0)
+                # Dividing by a power of ten rounded the other way keeps the quotient on the side of the bound.
+                with gmpy2.context(precision=bits + 2, round=inward, **exponents):
+                    power = gmpy2.mpfr(10) ** cut
+                with gmpy2.context(precision=bits + 2, round=rounding, **exponents):
+                    factors.append(gmpy2.mul_2exp(gmpy2.mpfr((mantissa >> shift) + upper), shift) / power)
+            with gmpy2.context(precision=2 * bits + 4, round=rounding, **exponents):
+                product = factors[0] * factors[1]
+                bounds.append(int(gmpy2.ceil(product) if upper else gmpy2.floor(product)))
+        return bounds[0], bounds[1]
+    
+    @instrument.timed('multiply.to_precision')
+    def multiply_to_precision(self, num1: bignum, num2: bignum, context: Context) -> bignum:
+        """
+        Calculate the product of two numbers, rounded to `context.precision` significant digits.
+        
+        Operands longer than the precision needs are truncated to `precision + guard_digits` 
+        digits, and the product is bracketed with `_product_bounds`. If both bounds round to 
+        the same value, that is the correctly rounded product and the full product is never 
+        computed; otherwise (a result within a hair of a rounding boundary) the exact product is rounded.
+        
+        Examples:
+            >>> Multiply().multiply_to_precision(bignum("3" * 40), bignum("-0.000000000000000000000000000000000003"), Context(precision=5))
+            bignum('-10000')
+        """
+        _, mantissa1, scale1 = num1._parts()
+        _, mantissa2, scale2 = num2._parts()
+        negative = num1.is_negative() != num2.is_negative() and bool(mantissa1 and mantissa2)
+        precision, rounding = context.precision, context.rounding
+        digits = precision + self.guard_digits
+        cut1, cut2 = (max(int(mantissa.bit_length() * _LOG10_2) - digits, 0) for mantissa in (mantissa1, mantissa2))
+        if cut1 or cut2:
+            scale = scale1 + scale2 - cut1 - cut2
+            low, high = (round_to_precision(negative, bound, scale, precision, rounding)
+                         for bound in self._product_bounds(mantissa1, cut1, mantissa2, cut2, digits))
+            if low == high:
+                return bignum._from_parts(negative, *low).filtered()
+        product = self.multiply_mantissas(mantissa1, mantissa2)
+        return bignum._from_parts(negative, *round_to_precision(negative, product, scale1 + scale2, precision, rounding)).filtered()
+    
+    def multiply_two_nums(self, num1: bignum, num2: bignum, use_cache=True) -> bignum:
+        """
+        Calculate the product of two numbers, rounded to the precision of the current context. 
+        Results are memoised when `cache` is set and `use_cache` is True.
+        """
+        context = getcontext()
+        if use_cache and self.cache is not None:
+            key = self.cache.key('*', num1, num2, extra=context.key)
+            result = self.cache.get(key)
+            if result is None:
+                result = self.multiply_two_nums(num1, num2, use_cache=False)
+                self.cache.put(key, result)
+            return result
+        
+        if context.precision is not None:
+            return self.multiply_to_precision(num1, num2, context)
+        
+        # The magnitude of the result only depends on the magnitudes of the operands;
+        # the result is negative when exactly one of the operands is.
+        result = self.multiply_two_positive_nums(num1.to_positive(), num2.to_positive())
+        return result.negate() if num1.is_negative() != num2.is_negative() else result
     
     def multiply(self, *args) -> bignum:
         """Calculate the product of the given numbers."""
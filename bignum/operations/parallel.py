@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+import threading
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it again if the number of workers has changed."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown():
+    """Shut down the shared process pool, if one was started."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor, _executor_workers = None, 0
+
+
+def to_bytes(value: int) -> bytes:
+    """
+    Pack a non-negative integer into a little-endian byte buffer.
+    
+    Examples:
+        >>> from_bytes(to_bytes(12345678901234567890))
+        12345678901234567890
+    """
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def from_bytes(buffer: bytes) -> int:
+    """Unpack a non-negative integer from a little-endian byte buffer."""
+    return int.from_bytes(buffer, 'little')
+
+
+def multiply_buffers(buffer1: bytes, buffer2: bytes, thresholds: Tuple[int, int, Optional[int]]) -> bytes:
+    """
+    Worker entry point: multiply two integers shipped as byte buffers with the serial multiplication engine.
+    
+    Args:
+        thresholds: The Karatsuba, Toom-3 and FFT crossover points of the calling engine.
+    """
+    # Imported here so that worker processes load the package through `bignum.bignum` first.
+    from ..bignum import Multiply
+    multiplier = Multiply()
+    multiplier.workers = None
+    multiplier.karatsuba_threshold, multiplier.toom3_threshold, multiplier.fft_threshold = thresholds
+    return to_bytes(multiplier.multiply_mantissas(from_bytes(buffer1), from_bytes(buffer2)))
@@ -0,0 +1,275 @@
+from typing import Callable, Optional, Tuple, Union
+import math
+import gmpy2
+
+from ..bignum import bignum, _LOG10_2, _strip_trailing_zeros
+from .. import instrument
+from ..context import Context, getcontext, round_to_precision
+from .multiply import Multiply
+from .division import Divide
+
+class Power:
+    multiplier = Multiply()
+    divider = Divide()
+
+    # Moduli with fewer digits than this are left to CPython's built-in three-argument pow.
+    # Larger moduli are reduced with Montgomery (odd moduli) or Barrett (even moduli)
+    # reduction, so that every step runs on the multiplication engine instead of a long division.
+    reduction_threshold = 500
+
+    # Digits kept beyond the context precision when bracketing a power between two bounds.
+    guard_digits = 3
+
+    @staticmethod
+    def _window_size(bits: int) -> int:
+        """Pick the sliding window width that needs the fewest multiplications for an exponent of `bits` bits."""
+        for size, limit in enumerate((8, 24, 80, 240, 672, 1792), start=1):
+            if bits <= limit:
+                return size
+        return 7
+
+    def sliding_window(self, base, exponent: int, multiply: Callable, square: Callable):
+        """
+        Raise `base` to a positive integer power with left-to-right sliding-window exponentiation.
+
+        The odd powers base, base**3, ..., base**(2**k - 1) are computed once. The exponent is then
+        scanned from its top bit: every bit costs a squaring, and every window of up to k bits that
+        starts and ends with a one costs a single multiplication by one of the odd powers.
+        `multiply` and `square` define the arithmetic, so the same loop serves plain and modular powers.
+
+        Examples:
+            >>> Power().sliding_window(3, 200, int.__mul__, lambda x: x * x) == 3**200
+            True
+        """
+        window = self._window_size(exponent.bit_length())
+        odd_powers = [base]
+        if window > 1:
+            base_squared = square(base)
+            for _ in range((1 << (window - 1)) - 1):
+                odd_powers.append(multiply(odd_powers[-1], base_squared))
+
+        result = None
+        bit = exponent.bit_length() - 1
+        while bit >= 0:
+            if not (exponent >> bit) & 1:
+                result = square(result)
+                bit -= 1
+                continue
+            low = max(bit - window + 1, 0)
+            while not (exponent >> low) & 1:
+                low += 1
+            if result is not None:
+                for _ in range(bit - low + 1):
+                    result = square(result)
+            value = odd_powers[((exponent >> low) & ((1 << (bit - low + 1)) - 1)) >> 1]
+            result = value if result is None else multiply(result, value)
+            bit = low - 1
+        return result
+
+    def power_mantissa(self, mantissa: int, exponent: int) -> int:
+        """
+        Raise a non-negative integer to a non-negative integer power.
+
+        Examples:
+            >>> Power().power_mantissa(12, 5)
+            248832
+        """
+        if exponent == 0:
+            return 1
+        if mantissa < 2:
+            return mantissa
+        return self.sliding_window(mantissa, exponent, self.multiplier.multiply_mantissas, self.multiplier.square_mantissa)
+
+    def _inverse_power_of_two(self, modulus: int, bits: int) -> int:
+        """Return the inverse of an odd modulus modulo 2**bits, by Newton (Hensel) lifting from one bit."""
+        multiply = self.multiplier.multiply_mantissas
+        inverse, precision = 1, 1
+        while precision < bits:
+            precision = min(2 * precision, bits)
+            mask = (1 << precision) - 1
+            error = (2 - multiply(modulus & mask, inverse)) & mask
+            inverse = multiply(inverse, error) & mask
+        return inverse
+
+    def montgomery_powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """
+        Calculate base**exponent % modulus for an odd modulus with Montgomery reduction.
+
+        Values are kept multiplied by R = 2**bits. Reducing a product then takes two
+        multiplications, a mask and a shift instead of a division by the modulus.
+
+        Examples:
+            >>> Power().montgomery_powmod(4, 13, 497)
+            445
+        """
+        bits = modulus.bit_length()
+        mask = (1 << bits) - 1
+        multiply, square = self.multiplier.multiply_mantissas, self.multiplier.square_mantissa
+        # modulus * factor == -1 (mod R)
+        factor = -self._inverse_power_of_two(modulus, bits) & mask
+
+        def reduce(value: int) -> int:
+            """Return value / R mod modulus, for value < modulus * R."""
+            value = (value + multiply(multiply(value & mask, factor) & mask, modulus)) >> bits
+            return value - modulus if value >= modulus else value
+
+        start = self.divider.divmod_mantissas(base << bits, modulus)[1]
+        result = self.sliding_window(start, exponent, lambda x, y: reduce(multiply(x, y)), lambda x: reduce(square(x)))
+        return reduce(result)
+
+    def barrett_powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """
+        Calculate base**exponent % modulus with Barrett reduction.
+
+        A scaled reciprocal of the modulus is computed once. Reducing a product then takes two
+        multiplications and at most two subtractions instead of a division by the modulus.
+
+        Examples:
+            >>> Power().barrett_powmod(4, 13, 498)
+            376
+        """
+        bits = modulus.bit_length()
+        multiply, square = self.multiplier.multiply_mantissas, self.multiplier.square_mantissa
+        reciprocal = self.divider.divmod_mantissas(1 << (2 * bits), modulus)[0]
+
+        def reduce(value: int) -> int:
+            """Return value % modulus, for value < modulus**2."""
+            value -= multiply(multiply(value >> (bits - 1), reciprocal) >> (bits + 1), modulus)
+            while value >= modulus:
+                value -= modulus
+            return value
+
+        start = self.divider.divmod_mantissas(base, modulus)[1]
+        return self.sliding_window(start, exponent, lambda x, y: reduce(multiply(x, y)), lambda x: reduce(square(x)))
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """Calculate base**exponent % modulus for non-negative integers, choosing the reduction by modulus size."""
+        if modulus == 1:
+            return 0
+        if exponent == 0:
+            return 1
+        stats = instrument.active
+        if modulus.bit_length() * _LOG10_2 < self.reduction_threshold:
+            if stats is not None: stats.count('powmod.tier.builtin')
+            return pow(base, exponent, modulus)
+        if modulus & 1:
+            if stats is not None: stats.count('powmod.tier.montgomery')
+            return self.montgomery_powmod(base, exponent, modulus)
+        if stats is not None: stats.count('powmod.tier.barrett')
+        return self.barrett_powmod(base, exponent, modulus)
+
+    def _power_bounds(self, mantissa: int, exponent: int, shift: int, digits: int) -> Tuple[int, int]:
+        """
+        Bound mantissa**exponent / 10**shift between two integers, looking only at the leading
+        bits of the mantissa. Powers and divisions are done with gmpy2.mpfr under directed
+        rounding, so the bounds are exact while costing a few short operations.
+        """
+        bits = int(digits / _LOG10_2) + exponent.bit_length() + 64
+        cut = max(mantissa.bit_length() - bits, 0)
+        leading = mantissa >> cut
+        exponents = dict(emax=gmpy2.get_emax_max(), emin=gmpy2.get_emin_min())
+        bounds = []
+        for rounding, inward in ((gmpy2.RoundDown, gmpy2.RoundUp), (gmpy2.RoundUp, gmpy2.RoundDown)):
+            upper = rounding == gmpy2.RoundUp
+            # A negative exponent turns the larger base into the smaller power.
+            base = leading + (cut > 0 and upper == (exponent > 0))
+            with gmpy2.context(precision=bits, round=inward, **exponents):
+                power_of_ten = gmpy2.mpfr(10) ** shift
+            with gmpy2.context(precision=bits, round=rounding, **exponents):
+                bound = gmpy2.mul_2exp(gmpy2.mpfr(base), cut) ** exponent / power_of_ten
+                bounds.append(int(gmpy2.ceil(bound) if upper else gmpy2.floor(bound)))
+        return bounds[0], bounds[1]
+
+    def power_to_precision(self, negative: bool, mantissa: int, scale: int, exponent: int, context: Context) -> bignum:
+        """
+        Raise mantissa * 10**-scale to an integer power, rounded to `context.precision` significant digits.
+
+        Large powers are bracketed with `_power_bounds`. If both bounds round to the same value,
+        that is the correctly rounded power and the exact power is never computed; otherwise the
+        exact power (or, for negative exponents, the quotient 1 / mantissa**-exponent) is rounded.
+
+        Examples:
+            >>> Power().power_to_precision(False, 11, 1, 100, Context(precision=5))
+            bignum('13781')
+            >>> Power().power_to_precision(False, 2, 0, -3, Context(precision=5))
+            bignum('0.125')
+        """
+        precision, rounding = context.precision, context.rounding
+        digits = precision + self.guard_digits
+        magnitude = exponent * (math.log10(mantissa >> max(mantissa.bit_length() - 64, 0)) + max(mantissa.bit_length() - 64, 0) * _LOG10_2)
+        if exponent < 0 or magnitude > 2 * digits:
+            shift = math.floor(magnitude) - digits
+            low, high = (round_to_precision(negative, bound, scale * exponent - shift, precision, rounding)
+                         for bound in self._power_bounds(mantissa, exponent, shift, digits))
+            if low == high:
+                return bignum._from_parts(negative, *low).filtered()
+        if exponent < 0:
+            denominator = bignum._from_parts(negative, self.power_mantissa(mantissa, -exponent), -scale * exponent)
+            return self.divider.divide_to_precision(bignum._from_parts(False, 1), denominator, context)
+        power = self.power_mantissa(mantissa, exponent)
+        return bignum._from_parts(negative, *round_to_precision(negative, power, scale * exponent, precision, rounding)).filtered()
+
+    @staticmethod
+    def _whole(num: bignum, name: str) -> int:
+        """Return the value of a whole number as an int, or raise ValueError."""
+        if num.filtered()._parts()[2] > 0:
+            raise ValueError(f"The {name} must be a whole number: {num}")
+        return int(num)
+
+    def power_mod(self, base: bignum, exponent: int, modulus: bignum) -> bignum:
+        """
+        Calculate base**exponent % modulus for whole numbers, with the sign conventions of the built-in pow.
+        A negative exponent uses the modular inverse of the base.
+        """
+        base, modulus = self._whole(base, 'base'), self._whole(modulus, 'modulus')
+        if not modulus:
+            raise ValueError("Modulus cannot be zero")
+        size = abs(modulus)
+        if exponent < 0:
+            base, exponent = pow(base, -1, size), -exponent
+        residue = self.divider.divmod_mantissas(abs(base), size)[1]
+        if base < 0 and residue:
+            residue = size - residue
+        return bignum(self.powmod(residue, exponent, size) % modulus)
+
+    @instrument.timed('power')
+    def power(self, base: Union[str, int, bignum], exponent: Union[str, int, bignum], modulus: Optional[Union[str, int, bignum]] = None) -> bignum:
+        """
+        Raise base to the power of a whole exponent, optionally modulo a whole modulus.
+
+        A decimal base keeps an exact scale: (m * 10**-s)**e = m**e * 10**(-s*e), so only the
+        mantissa, stripped of trailing zeros, is exponentiated. With a context precision the
+        result is rounded and negative exponents are allowed; without one, it is exact.
+
+        Examples:
+            >>> Power().power("1.5", 3)
+            bignum('3.375')
+            >>> Power().power("-2000", 3)
+            bignum('-8000000000')
+            >>> Power().power(4, 13, 497)
+            bignum('445')
+        """
+        base = base if isinstance(base, bignum) else bignum(base)
+        exponent = self._whole(exponent if isinstance(exponent, bignum) else bignum(exponent), 'exponent')
+        if modulus is not None:
+            return self.power_mod(base, exponent, modulus if isinstance(modulus, bignum) else bignum(modulus))
+
+        negative, mantissa, scale = base._parts()
+        if not mantissa:
+            if exponent < 0:
+                raise ValueError("Division by zero")
+            return bignum._from_parts(False, int(exponent == 0))
+        if exponent == 0:
+            return bignum._from_parts(False, 1)
+        mantissa, zeros = _strip_trailing_zeros(mantissa, mantissa.bit_length())
+        scale -= zeros
+        negative = negative and exponent % 2 == 1
+
+        context = getcontext()
+        if context.precision is not None:
+            return self.power_to_precision(negative, mantissa, scale, exponent, context)
+        if exponent < 0:
+            raise ValueError("Negative exponents need a context precision (see bignum.context.localcontext)")
+        return bignum._from_parts(negative, self.power_mantissa(mantissa, exponent), scale * exponent)
+
+power = Power().power
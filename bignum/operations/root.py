@@ -0,0 +1,164 @@
+from typing import Optional, Tuple, Union
+import math
+
+from ..bignum import bignum, _strip_trailing_zeros
+from .. import instrument
+from ..context import getcontext, round_to_precision
+from ..radix import digit_count
+from .division import Divide
+from .power import Power
+
+class Root:
+    divider = Divide()
+    power = Power()
+
+    # Roots of up to this many bits are seeded from a float estimate and finished with plain
+    # integer Newton steps. Larger roots are built by precision doubling (see `approximate_root`).
+    seed_bits = 48
+
+    def _seed_root(self, value: int, n: int) -> int:
+        """Return the floor of the n-th root of a value whose root has at most `seed_bits` bits."""
+        shift = max(value.bit_length() - 53, 0)
+        root = int(2 ** ((math.log2(value >> shift) + shift) / n)) + 2
+        while root ** n <= value:
+            root += 1
+        # Integer Newton steps decrease towards the floor of the root when started above it.
+        while True:
+            step = ((n - 1) * root + value // root ** (n - 1)) // n
+            if step >= root:
+                return root
+            root = step
+
+    def approximate_root(self, value: int, n: int) -> int:
+        """
+        Approximate the floor of the n-th root of a positive integer, never from below and
+        at most a few units above.
+
+        The root of the leading bits of the value, about half as many bits as the full root
+        plus a few guard bits, is computed recursively and shifted into place. One Newton step
+
+            x' = ((n - 1) * x + value // x**(n - 1)) // n
+
+        then doubles the number of correct bits. Early steps therefore run on short numbers and
+        only the last one works at full size. By the AM-GM inequality, a Newton step never lands
+        below the floor of the root, whatever it starts from.
+
+        Examples:
+            >>> Root().approximate_root(10**40, 2) - 10**20 in range(3)
+            True
+        """
+        bits = -(-value.bit_length() // n)
+        if bits <= self.seed_bits:
+            return self._seed_root(value, n)
+        dropped = bits // 2 - n.bit_length() - 2
+        root = self.approximate_root(value >> (n * dropped), n) << dropped
+        divisor = self.power.power_mantissa(root, n - 1)
+        quotient, _ = self.divider.divmod_mantissas(value, divisor)
+        return ((n - 1) * root + quotient) // n
+
+    @instrument.timed('root')
+    def root_mantissa(self, value: int, n: int) -> Tuple[int, int]:
+        """
+        Calculate the floor of the n-th root of a non-negative integer, exactly.
+
+        Returns:
+            Tuple[int, int]: The root and the remainder value - root**n.
+
+        Examples:
+            >>> Root().root_mantissa(10**30 + 5, 3)
+            (10000000000, 5)
+        """
+        if value < 2 or n == 1:
+            return value, 0
+        root = self.approximate_root(value, n)
+        power = self.power.power_mantissa(root, n)
+        while power > value:
+            root -= 1
+            power = self.power.power_mantissa(root, n)
+        return root, value - power
+
+    def isqrt(self, value: Union[str, int, bignum]) -> bignum:
+        """
+        Calculate the integer square root of a non-negative whole number, the largest integer whose square does not exceed it.
+
+        Examples:
+            >>> Root().isqrt("99999999999999999999")
+            bignum('9999999999')
+        """
+        value = value if isinstance(value, bignum) else bignum(value)
+        negative, mantissa, scale = value.filtered()._parts()
+        if scale > 0:
+            raise ValueError(f"The value must be a whole number: {value}")
+        if negative:
+            raise ValueError("Square root of a negative number")
+        return bignum._from_parts(False, self.root_mantissa(mantissa * 10**-scale, 2)[0])
+
+    def nth_root(self, value: Union[str, int, bignum], n: int, digits: Optional[int] = None) -> bignum:
+        """
+        Calculate the n-th root of a number, rounded to `digits` significant digits.
+
+        The value m * 10**-s is scaled to m * 10**t, with s + t a multiple of n and enough digits
+        for the root to have digits + 1 of them. Its integer root is exact, and the remainder tells
+        whether any nonzero digits follow, so the rounding is correct in every rounding mode.
+
+        Args:
+            digits (int): The number of significant digits (default: None, the precision of the
+            current context). Without either, the root must be exact, or ValueError is raised.
+
+        Examples:
+            >>> Root().nth_root("2", 2, digits=20)
+            bignum('1.4142135623730950488')
+            >>> Root().nth_root("-0.008", 3)
+            bignum('-0.2')
+        """
+        value = value if isinstance(value, bignum) else bignum(value)
+        n = int(n)
+        if n < 1:
+            raise ValueError(f"The root degree must be a positive integer: {n}")
+        context = getcontext()
+        digits = context.precision if digits is None else digits
+        if digits is not None and digits < 1:
+            raise ValueError("Precision must be at least one significant digit")
+
+        negative, mantissa, scale = value._parts()
+        if negative and n % 2 == 0:
+            raise ValueError("Even root of a negative number")
+        if not mantissa:
+            return bignum._from_parts(False, 0)
+        mantissa, zeros = _strip_trailing_zeros(mantissa, mantissa.bit_length())
+        scale -= zeros
+
+        # An exact root can only come from the smallest shift, as the mantissa has no trailing zeros.
+        shift = -scale % n
+        if digits is not None:
+            needed = n * (digits + 1) - digit_count(mantissa)
+            shift = needed + (shift - needed) % n
+        if shift >= 0:
+            root, remainder = self.root_mantissa(self.divider.multiplier.multiply_mantissas(mantissa, 10**shift), n)
+            sticky = bool(remainder)
+        else:
+            truncated, dropped = self.divider.divmod_mantissas(mantissa, 10**-shift)
+            root, remainder = self.root_mantissa(truncated, n)
+            sticky = bool(remainder or dropped)
+        root_scale = (scale + shift) // n
+
+        if digits is None:
+            if sticky:
+                raise ValueError("The root is not exact; pass `digits` or set a context precision")
+            return bignum._from_parts(negative, root, root_scale)
+        rounding = context.rounding
+        return bignum._from_parts(negative, *round_to_precision(negative, root, root_scale, digits, rounding, sticky)).filtered()
+
+    def sqrt(self, value: Union[str, int, bignum], digits: Optional[int] = None) -> bignum:
+        """
+        Calculate the square root of a number, rounded to `digits` significant digits (see `nth_root`).
+
+        Examples:
+            >>> Root().sqrt("0.0144")
+            bignum('0.12')
+        """
+        return self.nth_root(value, 2, digits)
+
+isqrt = Root().isqrt
+nth_root = Root().nth_root
+sqrt = Root().sqrt
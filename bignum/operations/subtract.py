@@ -0,0 +1,62 @@
+from ..bignum import bignum  
+from .. import instrument
+from ..context import getcontext
+
+class Subtract:
+    @staticmethod
+    def _add_magnitudes(num1: bignum, num2: bignum) -> bignum:
+        """Calculate the sum of the absolute values of two numbers with the addition engine."""
+        # Imported here because the add module imports this one.
+        from ..bignum import _adder
+        return _adder.add_two_positive_nums(num1.to_positive(), num2.to_positive())
+    
+    @instrument.timed('subtract.exact')
+    def subtract_two_positive_nums(self, num1: bignum, num2: bignum) -> bignum:
+        """
+        Calculate the difference of two positive numbers.
+        
+        Examples:
+            >>> Subtract().subtract_two_positive_nums(bignum("10.5"), bignum("0.75"))
+            bignum('9.75')
+            >>> Subtract().subtract_two_positive_nums(bignum("3"), bignum("12.25"))
+            bignum('-9.25')
+        """
+        
+        # Bring both mantissas to a common scale so that the digits line up. CPython's int 
+        # subtraction then propagates the borrows across the limbs in a single pass.
+        mantissa1, mantissa2, scale = bignum._align_scales(num1, num2)
+        difference = mantissa1 - mantissa2
+        return bignum._from_parts(difference < 0, abs(difference), scale).filtered()
+    
+    def subtract_two_nums(self, num1: bignum, num2: bignum) -> bignum:
+        """Calculate the difference of two numbers, rounded to the precision of the current context."""
+        num1_positive, num2_positive = num1.is_positive(), num2.is_positive()
+        if num1_positive and num2_positive:
+            result = self.subtract_two_positive_nums(num1, num2)
+        elif num1_positive:
+            # a - (-b) = a + b
+            result = self._add_magnitudes(num1, num2)
+        elif num2_positive:
+            # -a - b = -(a + b)
+            result = self._add_magnitudes(num1, num2).negate()
+        else:
+            # -a - (-b) = b - a
+            result = self.subtract_two_positive_nums(num2.to_positive(), num1.to_positive())
+        return getcontext().apply(result)
+    
+    def subtract(self, *args) -> bignum:
+        """
+        Subtract the remaining numbers from the first one.
+        
+        Examples:
+            >>> Subtract().subtract("10", "2.5", "-4")
+            bignum('11.5')
+        """
+        if not args: 
+            return bignum('0')
+        final_result = bignum(args[0])
+        for item in args[1:]:
+            final_result = self.subtract_two_nums(final_result, bignum(item))
+        return final_result
+
+subtract = Subtract().subtract
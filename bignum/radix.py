@@ -0,0 +1,246 @@
+from typing import Callable, Iterator, List, Optional, Tuple
+import math
+import gmpy2
+
+from . import instrument
+
+# Digit strings up to this length are converted by CPython directly. It stays below CPython's
+# limit on int/str conversions (see `sys.set_int_max_str_digits`), and above it CPython's
+# quadratic conversion is slower than splitting.
+BASE_DIGITS = 2000
+
+_LOG10_2 = math.log10(2)
+
+# Powers of ten used to split values, by exponent. Every exponent is BASE_DIGITS * 2**j,
+# so the cache holds one power per level of the split and is shared by all conversions.
+_powers_of_ten = {}
+
+# Newton reciprocals of the cached powers of ten, with their precision, by exponent.
+_reciprocals = {}
+
+
+def _engines():
+    """Return the multiplication and division engines used for the large products and quotients."""
+    # Imported here because the engines themselves import the bignum module, which imports this one.
+    from .bignum import _multiplier, _divider
+    return _multiplier.multiply_mantissas, _divider.divmod_mantissas
+
+
+def _divmod_power(value: int, exponent: int, power: int) -> Tuple[int, int]:
+    """
+    Divide `value` < 10**(2 * exponent) by power = 10**exponent.
+    
+    Large powers are divided through a Newton reciprocal that is computed once per power
+    and reused for every split at the same level.
+    """
+    from .bignum import _divider
+    if exponent < _divider.newton_threshold:
+        return _divider.divmod_mantissas(value, power)
+    entry = _reciprocals.get(exponent)
+    if entry is None:
+        precision = power.bit_length() + 1 + _divider._guard_bits
+        entry = _reciprocals[exponent] = (_divider.reciprocal(power, precision), precision)
+    return _divider.divmod_by_reciprocal(value, power, *entry)
+
+
+def digit_count(value: int) -> int:
+    """
+    Return the number of decimal digits of a non-negative integer, counting zero as one digit.
+    
+    Examples:
+        >>> digit_count(999), digit_count(1000), digit_count(0)
+        (3, 4, 1)
+    """
+    # GMP's estimate is exact or one too high.
+    count = int(gmpy2.num_digits(value, 10))
+    if count > 1 and value < gmpy2.mpz(10) ** (count - 1):
+        count -= 1
+    return count
+
+
+def _split_size(digits: int) -> int:
+    """Return the largest BASE_DIGITS * 2**j that is smaller than `digits`."""
+    size = BASE_DIGITS
+    while 2 * size < digits:
+        size *= 2
+    return size
+
+
+def power_of_ten(exponent: int, multiply: Callable[[int, int], int] = None) -> int:
+    """
+    Return 10**exponent for an exponent of the form BASE_DIGITS * 2**j, caching the result.
+
+    Each power is the square of the one below it, so building the largest power also fills in the smaller ones.
+    """
+    power = _powers_of_ten.get(exponent)
+    if power is None:
+        if exponent <= BASE_DIGITS:
+            power = 10**exponent
+        else:
+            if multiply is None:
+                multiply, _ = _engines()
+            half = power_of_ten(exponent // 2, multiply)
+            power = multiply(half, half)
+        _powers_of_ten[exponent] = power
+    return power
+
+
+def digits_to_int(digits: str) -> int:
+    """
+    Convert a string of decimal digits into an integer.
+
+    Long strings are split in two so that the lower part has BASE_DIGITS * 2**j digits;
+    both halves are converted recursively and recombined as high * 10**len(low) + low.
+
+    Examples:
+        >>> digits_to_int("00123")
+        123
+        >>> digits_to_int("9" * 5000) == 10**5000 - 1
+        True
+    """
+    if len(digits) <= BASE_DIGITS:
+        return int(digits)
+    multiply, _ = _engines()
+
+    def convert(start: int, end: int) -> int:
+        if end - start <= BASE_DIGITS:
+            return int(digits[start:end])
+        size = _split_size(end - start)
+        high = convert(start, end - size)
+        return multiply(high, power_of_ten(size, multiply)) + convert(end - size, end)
+
+    return convert(0, len(digits))
+
+
+class DigitAccumulator:
+    """
+    Build an integer from decimal digits that arrive in pieces, most significant first.
+    
+    Digits are grouped into blocks of BASE_DIGITS, and blocks are merged pairwise like a 
+    binary counter: two values of BASE_DIGITS * 2**j digits are combined as soon as both 
+    are complete. Every merge multiplies by a cached power of ten and the partial values 
+    stay balanced, so no digit string longer than one block is ever held in memory.
+    
+    Examples:
+        >>> accumulator = DigitAccumulator()
+        >>> accumulator.feed(b"0012")
+        >>> accumulator.feed(b"345", 1)
+        >>> accumulator.digits, accumulator.value()
+        (6, 1245)
+    """
+    
+    def __init__(self):
+        self.digits = 0
+        self._head = b''
+        self._stack: List[Tuple[int, int]] = []
+        self._multiply, _ = _engines()
+    
+    def feed(self, buffer, start: int = 0, end: Optional[int] = None):
+        """
+        Append the ASCII digits buffer[start:end]. The buffer can be any bytes-like object, 
+        such as bytes, a memoryview or an mmap; only one block is copied out of it at a time.
+        """
+        end = len(buffer) if end is None else end
+        self.digits += max(end - start, 0)
+        if self._head:
+            take = min(BASE_DIGITS - len(self._head), end - start)
+            self._head += bytes(buffer[start:start + take])
+            start += take
+            if len(self._head) < BASE_DIGITS:
+                return
+            self._push(int(self._head))
+        while end - start >= BASE_DIGITS:
+            self._push(int(bytes(buffer[start:start + BASE_DIGITS])))
+            start += BASE_DIGITS
+        self._head = bytes(buffer[start:end])
+    
+    def _push(self, block: int):
+        stack, size = self._stack, BASE_DIGITS
+        while stack and stack[-1][1] == size:
+            high, _ = stack.pop()
+            block = self._multiply(high, power_of_ten(size, self._multiply)) + block
+            size *= 2
+        stack.append((block, size))
+    
+    def value(self) -> int:
+        """Return the integer formed by all the digits fed so far."""
+        value = 0
+        for block, size in self._stack:
+            value = self._multiply(value, power_of_ten(size, self._multiply)) + block
+        if self._head:
+            value = value * 10**len(self._head) + int(self._head)
+        return value
+
+
+def _next_chunk(pending: List[Tuple[int, int]], multiply: Callable[[int, int], int]) -> str:
+    """
+    Split the most significant pending part until it is short enough for CPython and return its digits.
+    
+    `pending` is a stack of (part, width) pairs: the lower half of every split is pushed 
+    before the upper half, so popping yields the digits most significant first.
+    """
+    while True:
+        part, part_width = pending.pop()
+        digits = part.bit_length() * _LOG10_2
+        if digits < BASE_DIGITS:
+            return str(part).zfill(part_width)
+        # The digit count estimated from the bit length can be one too high.
+        size = _split_size(int(digits) + 1)
+        power = power_of_ten(size, multiply)
+        while part < power and size > BASE_DIGITS:
+            size //= 2
+            power = power_of_ten(size, multiply)
+        if part < power:
+            return str(part).zfill(part_width)
+        high, low = _divmod_power(part, size, power)
+        pending.append((low, size))
+        pending.append((high, part_width - size))
+
+
+def digit_chunks(value: int, width: int = 0) -> Tuple[int, Iterator[str]]:
+    """
+    Convert a non-negative integer into decimal digits, zero-padded to `width`, one chunk at a time.
+    
+    Large values are split by divmod with a cached power of ten 10**k, k = BASE_DIGITS * 2**j; 
+    the quotient and the remainder, padded to k digits, are converted recursively. Only the 
+    leading chunk is converted up front, so the digits can be written out without building 
+    the whole string.
+    
+    Returns:
+        Tuple[int, Iterator[str]]: The total number of digits, and the chunks in order.
+    
+    Examples:
+        >>> total, chunks = digit_chunks(10**5000 - 1)
+        >>> total, {len(chunk) for chunk in chunks}
+        (5000, {1000, 2000})
+    """
+    if value.bit_length() * _LOG10_2 < BASE_DIGITS:
+        digits = str(value).zfill(width)
+        return len(digits), iter((digits,))
+    multiply, _ = _engines()
+    pending = [(value, width)]
+    first = _next_chunk(pending, multiply)
+    total = len(first) + sum(size for _, size in pending)
+    
+    def chunks() -> Iterator[str]:
+        yield first
+        while pending:
+            yield _next_chunk(pending, multiply)
+    
+    return total, chunks()
+
+
+@instrument.timed('radix.int_to_digits')
+def int_to_digits(value: int, width: int = 0) -> str:
+    """
+    Convert a non-negative integer into a string of decimal digits, zero-padded to `width`.
+    
+    See `digit_chunks` for the conversion.
+    
+    Examples:
+        >>> int_to_digits(123, width=5)
+        '00123'
+        >>> int_to_digits(10**5000 - 1) == "9" * 5000
+        True
+    """
+    return ''.join(digit_chunks(value, width)[1])
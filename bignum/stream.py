@@ -0,0 +1,348 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+import io
+import mmap
+import os
+import re
+
+from .bignum import bignum, _adder
+from .radix import BASE_DIGITS, DigitAccumulator, digit_chunks
+
+# Bytes read from a file object at a time, and written to one at a time.
+BLOCK_SIZE = 1 << 20
+
+_SPACE = re.compile(rb'\s*')
+_DIGITS = re.compile(rb'[0-9]*')
+
+# Parser states, in the order a number is read.
+_LEAD, _WHOLE, _DECIMAL = range(3)
+
+
+class _NumberParser:
+    """
+    Parse one number from a sequence of byte blocks.
+
+    The number is written as `bignum` accepts it: an optional sign, the whole digits and an optional
+    decimal part. Like the constructor, exponent notation is rejected. Digits go straight into a
+    DigitAccumulator, so the number can be split across any number of blocks and is never held
+    as one string.
+    """
+
+    def __init__(self):
+        self.state = _LEAD
+        self.negative = False
+        self.mantissa = DigitAccumulator()
+        self.decimals = 0
+
+    @property
+    def started(self) -> bool:
+        return self.state != _LEAD
+
+    def feed(self, block, pos: int = 0) -> Optional[int]:
+        """
+        Parse block[pos:].
+
+        Returns:
+            Optional[int]: The position of the whitespace that ends the number, or None if
+            the block ran out before the number ended.
+        """
+        end = len(block)
+        while pos < end:
+            if self.state == _LEAD:
+                pos = _SPACE.match(block, pos).end()
+                if pos == end:
+                    return None
+                if block[pos] in b'+-':
+                    self.negative = block[pos] == ord('-')
+                    pos += 1
+                self.state = _WHOLE
+            elif self.state in (_WHOLE, _DECIMAL):
+                digits_end = _DIGITS.match(block, pos).end()
+                self.mantissa.feed(block, pos, digits_end)
+                if self.state == _DECIMAL:
+                    self.decimals += digits_end - pos
+                pos = digits_end
+                if pos == end:
+                    return None
+                if block[pos] == ord('.') and self.state == _WHOLE:
+                    self.state, pos = _DECIMAL, pos + 1
+                else:
+                    return self._terminate(block, pos)
+        return None
+
+    def _terminate(self, block, pos: int) -> int:
+        character = bytes(block[pos:pos + 1])
+        if not character.isspace():
+            raise ValueError(f"Invalid character in number: {character!r}")
+        return pos
+
+    def result(self) -> bignum:
+        """Return the parsed number, once the number has ended."""
+        if not self.mantissa.digits:
+            raise ValueError("Invalid value: incomplete number")
+        return bignum._from_parts(self.negative, self.mantissa.value(), self.decimals)
+
+
+def _parse(blocks: Iterator) -> Iterator[Tuple[bignum, object, int]]:
+    """
+    Parse whitespace-separated numbers from a sequence of byte blocks.
+
+    Yields:
+        The numbers, each with the block and the position in it where the number ended
+        (None and 0 for a number that ran to the end of the input).
+    """
+    parser = _NumberParser()
+    for block in blocks:
+        pos = 0
+        while True:
+            pos = parser.feed(block, pos)
+            if pos is None:
+                break
+            yield parser.result(), block, pos
+            parser = _NumberParser()
+    if parser.started:
+        yield parser.result(), None, 0
+
+
+def _file_blocks(file) -> Iterator[bytes]:
+    """Read a binary or text file object in blocks of BLOCK_SIZE bytes."""
+    while True:
+        block = file.read(BLOCK_SIZE)
+        if not block:
+            return
+        yield block.encode('ascii') if isinstance(block, str) else block
+
+
+@contextmanager
+def _mapped(source):
+    """Expose a path or an open file as a read-only mmap. Bytes-like objects are used as they are."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file, _mapped(file) as buffer:
+            yield buffer
+    elif hasattr(source, 'fileno'):
+        if not os.fstat(source.fileno()).st_size:
+            # Empty files cannot be mapped.
+            yield b''
+        else:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+    else:
+        yield source
+
+
+def _blocks(source) -> Iterator:
+    """Turn a path, a file object or a bytes-like object into a sequence of byte blocks."""
+    if isinstance(source, (str, os.PathLike)):
+        with _mapped(source) as buffer:
+            if len(buffer):
+                yield buffer
+    elif hasattr(source, 'read'):
+        yield from _file_blocks(source)
+    else:
+        yield source
+
+
+def iter_numbers(source: Union[str, os.PathLike, BinaryIO, bytes, memoryview, mmap.mmap]) -> Iterator[bignum]:
+    """
+    Read every whitespace-separated number from a file or a buffer.
+
+    Args:
+        source: A path, which is memory-mapped, an open file object in binary or text mode,
+        or a bytes-like object such as an mmap.
+
+    Examples:
+        >>> list(iter_numbers(b"12.50\\n-300\\n\\n"))
+        [bignum('12.50'), bignum('-300')]
+    """
+    for number, _, _ in _parse(_blocks(source)):
+        yield number
+
+
+def from_buffer(buffer) -> bignum:
+    """
+    Parse a bytes-like object, such as an mmap, that holds exactly one number.
+
+    Examples:
+        >>> from_buffer(memoryview(b" -0012.5 "))
+        bignum('-12.5')
+
+        It accepts and rejects the same values as the constructor:
+
+        >>> def accepts(parse, value):
+        ...     try:
+        ...         parse(value)
+        ...     except ValueError:
+        ...         return False
+        ...     return True
+        >>> values = ["7", "+7", "-.5", "5.", "7e3", "7E3", "2.5e-1", "1.2.3", "--1", "12a"]
+        >>> [accepts(bignum, value) for value in values] == [accepts(from_buffer, value.encode()) for value in values]
+        True
+        >>> [value for value in values if accepts(from_buffer, value.encode())]
+        ['7', '+7', '-.5', '5.']
+    """
+    parsed = next(_parse(iter((buffer,))), None)
+    if parsed is None:
+        raise ValueError("Invalid value: no number in buffer")
+    number, block, pos = parsed
+    if block is not None and _SPACE.match(buffer, pos).end() != len(buffer):
+        raise ValueError("Invalid value: more than one number in buffer")
+    return number
+
+
+def from_file(file: Union[str, os.PathLike, BinaryIO]) -> bignum:
+    """
+    Read the first number from a file.
+
+    Args:
+        file: A path, which is memory-mapped, or an open file object. A seekable binary file
+        is left positioned just after the number, so repeated calls read consecutive numbers.
+    """
+    if hasattr(file, 'read'):
+        for number, block, pos in _parse(_file_blocks(file)):
+            # Text files re-encode their blocks, so their positions cannot be rewound by byte counts.
+            if block is not None and not isinstance(file, io.TextIOBase) and file.seekable():
+                file.seek(pos - len(block), io.SEEK_CUR)
+            return number
+    else:
+        for number in iter_numbers(file):
+            return number
+    raise ValueError("Invalid value: no number in file")
+
+
+def to_file(num: bignum, file: Union[str, os.PathLike, BinaryIO]):
+    """
+    Write a number to a file without building its full decimal string.
+
+    Args:
+        file: A path, which is overwritten, or an open file object in binary or text mode.
+
+    Examples:
+        >>> out = io.BytesIO()
+        >>> to_file(bignum("-1.05"), out)
+        >>> out.getvalue()
+        b'-1.05'
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'wb') as out:
+            return to_file(num, out)
+    text = isinstance(file, io.TextIOBase)
+    for piece in _pieces(num):
+        file.write(piece if text else piece.encode('ascii'))
+
+
+def _pieces(num: bignum) -> Iterator[str]:
+    """Yield the decimal representation of a number in pieces, as `str` would render it."""
+    negative, mantissa, scale = num._parts()
+    if negative:
+        yield '-'
+    total, chunks = digit_chunks(mantissa, scale + 1)
+    # Number of digits before the decimal point, if there is one.
+    point = total - scale if scale > 0 else None
+    written = 0
+    for chunk in chunks:
+        if point is not None and written <= point < written + len(chunk):
+            yield chunk[:point - written]
+            yield '.'
+            chunk = chunk[point - written:]
+            written, point = point, None
+        yield chunk
+        written += len(chunk)
+    if scale < 0 and mantissa:
+        for start in range(0, -scale, BLOCK_SIZE):
+            yield '0' * min(BLOCK_SIZE, -scale - start)
+
+
+def _digit_span(buffer) -> Tuple[int, int]:
+    """Return the start and end of a whole number in a buffer, without the surrounding whitespace."""
+    start, end = _SPACE.match(buffer).end(), len(buffer)
+    while end > start and bytes(buffer[end - 1:end]).isspace():
+        end -= 1
+    if start == end:
+        raise ValueError("Invalid value: no digits in input")
+    return start, end
+
+
+def _reversed_chunks(buffer, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    while end > start:
+        yield bytes(buffer[max(end - chunk_size, start):end])
+        end -= chunk_size
+
+
+def reversed_chunks(source, chunk_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Read the digits of a whole number from the end, in chunks of `chunk_size` digits.
+
+    Args:
+        source: A path or an open file, which are memory-mapped, or a bytes-like object.
+
+    Examples:
+        >>> list(reversed_chunks(b"1234567\\n", chunk_size=3))
+        [b'567', b'234', b'1']
+    """
+    with _mapped(source) as buffer:
+        yield from _reversed_chunks(buffer, *_digit_span(buffer), chunk_size)
+
+
+def _aligned_digits(buffer, span: Tuple[int, int], length: int, offset: int, width: int) -> bytes:
+    """
+    Return the digits at positions offset to offset + width of a whole number right-aligned
+    to `length` digits, leaving out the leading zeros the alignment would add.
+    """
+    start, end = span
+    padding = length - (end - start)
+    low, high = max(offset, padding), offset + width
+    return bytes(buffer[start + low - padding:start + high - padding]) if high > low else b''
+
+
+def _final_carry(buffer1, span1: Tuple[int, int], buffer2, span2: Tuple[int, int]) -> int:
+    """
+    Find whether the sum of two whole numbers has one more digit than the longer of them.
+
+    The digits are compared from the most significant end: the carry out of a block is settled
+    as soon as the two blocks do not add up to all nines, which is almost always the first block.
+    """
+    length = max(span1[1] - span1[0], span2[1] - span2[0])
+    for offset in range(0, length, BASE_DIGITS):
+        width = min(BASE_DIGITS, length - offset)
+        total = sum(int(_aligned_digits(buffer, span, length, offset, width) or 0) for buffer, span in ((buffer1, span1), (buffer2, span2)))
+        if total != 10**width - 1:
+            return int(total > 10**width - 1)
+    return 0
+
+
+def add_files(source1, source2, out: Union[str, os.PathLike, BinaryIO]) -> int:
+    """
+    Add two non-negative whole numbers stored as digit files, writing the sum to `out`.
+
+    The operands are read from the end with `reversed_chunks` and added by `Add.stream_add`,
+    so memory use is bounded by a few chunks however long the numbers are. The length of the
+    sum is settled first, which lets every chunk be written straight to its place in the output.
+
+    Args:
+        source1, source2: Paths, open files or bytes-like objects, each holding one whole number.
+        out: A path, which is overwritten, or a seekable binary file, written from its current position.
+
+    Returns:
+        int: The number of digits written.
+
+    Examples:
+        >>> out = io.BytesIO()
+        >>> add_files(b"99999", b"1\\n", out), out.getvalue()
+        (6, b'100000')
+    """
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, 'wb') as file:
+            return add_files(source1, source2, file)
+    with _mapped(source1) as buffer1, _mapped(source2) as buffer2:
+        span1, span2 = _digit_span(buffer1), _digit_span(buffer2)
+        length = max(span1[1] - span1[0], span2[1] - span2[0]) + _final_carry(buffer1, span1, buffer2, span2)
+        base = out.tell()
+        position = base + length
+        chunks = _adder.stream_add(_reversed_chunks(buffer1, *span1, BLOCK_SIZE), _reversed_chunks(buffer2, *span2, BLOCK_SIZE))
+        for chunk in chunks:
+            position -= len(chunk)
+            out.seek(position)
+            out.write(chunk.encode('ascii'))
+        out.seek(base + length)
+    return length
@@ -1,3 +1,4 @@
+from .benchmark import BenchmarkReport, BenchmarkResult, Regression
 from .input_values import InputValues
 from .multi_test_result import MultiTestResult
 from .num_properties import NumProperties
@@ -0,0 +1,185 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Optional, TextIO, Union
+import csv
+import io
+import json
+import math
+import os
+import platform
+import statistics
+
+import gmpy2
+
+# Operand sizes swept by default, in decimal digits.
+DEFAULT_SIZES = (10, 100, 1000, 10**4, 10**5, 10**6, 10**7)
+
+# A median this much slower than the baseline's is reported as a regression.
+DEFAULT_THRESHOLD = 0.10
+
+CSV_FIELDS = ('operation', 'digits', 'repetitions', 'median', 'p95', 'stddev', 'mean', 'best')
+
+
+def _environment() -> dict:
+    """Describe the machine and the engine crossover points, so that reports can be told apart."""
+    # Imported here because the engines import the bignum module, which imports them in turn.
+    from ..bignum import Multiply, Divide, Power
+    thresholds = {
+        f"{engine.__name__}.{name}": getattr(engine, name)
+        for engine in (Multiply, Divide, Power)
+        for name in dir(engine) if name.endswith('_threshold')
+    }
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'cpus': os.cpu_count(),
+        'gmpy2': gmpy2.version(),
+        'thresholds': thresholds,
+    }
+
+
+@dataclass
+class BenchmarkResult:
+    """The timings of one operation at one operand size, in seconds."""
+    operation: str
+    digits: int
+    times: list[float]
+
+    @property
+    def repetitions(self) -> int:
+        return len(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile, by the nearest-rank method."""
+        ordered = sorted(self.times)
+        return ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    def as_dict(self, include_times=True) -> dict:
+        result = {name: getattr(self, name) for name in CSV_FIELDS}
+        if include_times:
+            result['times'] = list(self.times)
+        return result
+
+    def as_str(self) -> str:
+        return " | ".join((
+            f"{self.operation} {self.digits} digits",
+            f"median {self.median:.6g}s",
+            f"p95 {self.p95:.6g}s",
+            f"stddev {self.stddev:.3g}s",
+            f"x{self.repetitions}",
+        ))
+
+
+@dataclass
+class Regression:
+    """A benchmark whose median time grew beyond the threshold against the baseline."""
+    operation: str
+    digits: int
+    baseline_median: float
+    median: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median / self.baseline_median
+
+    def as_str(self) -> str:
+        return f"{self.operation} {self.digits} digits: {self.baseline_median:.6g}s -> {self.median:.6g}s ({self.ratio:.2f}x slower)"
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    The results of a benchmark sweep, with the settings that produced them.
+
+    Reports round-trip through JSON, so a saved run can serve as the baseline of a later one.
+
+    Examples:
+        >>> old = BenchmarkReport([BenchmarkResult('*', 1000, [1.0, 1.2, 1.1])])
+        >>> new = BenchmarkReport([BenchmarkResult('*', 1000, [1.5, 1.4, 1.6])])
+        >>> [regression.as_str() for regression in new.compare(BenchmarkReport.from_json(old.to_json()))]
+        ['* 1000 digits: 1.1s -> 1.5s (1.36x slower)']
+    """
+    results: list[BenchmarkResult] = field(default_factory=list)
+    seed: int = 0
+    warmup: int = 1
+    repetitions: int = 5
+    environment: dict = field(default_factory=_environment)
+
+    def as_dict(self) -> dict:
+        return {
+            'seed': self.seed,
+            'warmup': self.warmup,
+            'repetitions': self.repetitions,
+            'environment': self.environment,
+            'results': [result.as_dict() for result in self.results],
+        }
+
+    def to_json(self, file: Optional[Union[str, os.PathLike, TextIO]] = None) -> str:
+        """Return the report as JSON, also writing it to `file` (a path or an open text file) if given."""
+        text = json.dumps(self.as_dict(), indent=2)
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'w') as out:
+                out.write(text)
+        elif file is not None:
+            file.write(text)
+        return text
+
+    def to_csv(self, file: Optional[Union[str, os.PathLike, TextIO]] = None) -> str:
+        """Return the summary statistics as CSV, one row per result, also writing them to `file` if given."""
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for result in self.results:
+            writer.writerow(result.as_dict(include_times=False))
+        text = out.getvalue()
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'w', newline='') as csv_file:
+                csv_file.write(text)
+        elif file is not None:
+            file.write(text)
+        return text
+
+    @classmethod
+    def from_json(cls, source: Union[str, os.PathLike, TextIO]) -> BenchmarkReport:
+        """Load a report from a JSON string, a path or an open text file."""
+        if hasattr(source, 'read'):
+            data = json.load(source)
+        elif isinstance(source, str) and source.lstrip().startswith('{'):
+            data = json.loads(source)
+        else:
+            with open(source) as file:
+                data = json.load(file)
+        results = [BenchmarkResult(result['operation'], result['digits'], result['times']) for result in data['results']]
+        return cls(results, data['seed'], data['warmup'], data['repetitions'], data.get('environment', {}))
+
+    def compare(self, baseline: BenchmarkReport, threshold: float = DEFAULT_THRESHOLD) -> list[Regression]:
+        """
+        Find the results whose median is more than `threshold` (a fraction) slower than the
+        baseline's median for the same operation and size. Sizes missing from either report are skipped.
+        """
+        previous = {(result.operation, result.digits): result for result in baseline.results}
+        regressions = []
+        for result in self.results:
+            old = previous.get((result.operation, result.digits))
+            if old is not None and result.median > old.median * (1 + threshold):
+                regressions.append(Regression(result.operation, result.digits, old.median, result.median))
+        return regressions
@@ -1,76 +1,98 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, InitVar
+from typing import Iterable
 from .test_result import TestResult
-from decimal import Decimal
+from .quantile_sketch import QuantileSketch
 
 @dataclass
 class MultiTestResult:
-    tests: list[TestResult] = field(default_factory=list)
-    
-    def __post_init__(self):
+    """
+    Running statistics over many tests, in memory that does not grow with the number of tests.
+
+    Times are summed in integer nanoseconds and summarised by quantile sketches. Only the first
+    `keep` correct and `keep` incorrect results are kept, in `true_list` and `false_list`.
+    """
+    tests: InitVar[Iterable[TestResult]] = ()
+    keep: int = 100
+
+    def __post_init__(self, tests):
         self.true_list = []
         self.false_list = []
-        self.total_builtin_time = Decimal('0')
-        self.total_algorithm_time = Decimal('0')
+        self.no_of_tests = 0
+        self.correct_results = 0
+        self.total_builtin_time = 0
+        self.total_algorithm_time = 0
+        self.builtin_times = QuantileSketch()
+        self.algorithm_times = QuantileSketch()
         self.best_time_difference = [None, None]
         self.worst_time_difference = [None, None]
-        
-        for test in self.tests:
+
+        for test in tests:
             self.update_test_results(test)
-            
-    @property
-    def no_of_tests(self):
-        return len(self.tests)
-    @property
-    def correct_results(self):
-        return len(self.true_list)
+
     @property
     def incorrect_results(self):
-        return len(self.false_list)
+        return self.no_of_tests - self.correct_results
     @property
     def accuracy(self):
         return self.correct_results/self.no_of_tests*100
     @property
     def average_algorithm_time(self):
-        return self.total_algorithm_time/self.no_of_tests
+        return self.total_algorithm_time//self.no_of_tests
     @property
     def average_builtin_time(self):
-        return self.total_builtin_time/self.no_of_tests
+        return self.total_builtin_time//self.no_of_tests
     @property
     def time_difference(self):
         if self.total_algorithm_time > self.total_builtin_time:
             return [round(self.total_algorithm_time/self.total_builtin_time, 2), "Slower"]
         elif self.total_builtin_time > self.total_algorithm_time:
-            return [round(self.total_builtin_time/self.total_algorithm_time, 2), "Faster"] 
+            return [round(self.total_builtin_time/self.total_algorithm_time, 2), "Faster"]
         return [1, "Equal"]
-            
+
     def append_test(self, test: TestResult, print_test=False):
-        self.tests.append(test)
         self.update_test_results(test)
         if print_test:
             print(test.as_str())
-            
-    def _update_time_difference(self, test: TestResult):
-        time_difference = test.time_difference
-        if self.best_time_difference == [None, None]: self.best_time_difference = time_difference 
+
+    def _update_time_difference(self, time_difference):
+        if time_difference == [None, None]: return
+        if self.best_time_difference == [None, None]: self.best_time_difference = time_difference
         if self.worst_time_difference == [None, None]: self.worst_time_difference = time_difference
-            
+
         if self.best_time_difference[1] in ["Slower", "Equal"]:
             if (time_difference[1] == "Faster" and (self.best_time_difference[0] == "Equal" or time_difference[0] < self.best_time_difference[0])) or (time_difference[1] == "Equal") or (time_difference[0] < self.best_time_difference[0]):
                 self.best_time_difference = time_difference
         elif time_difference[0] > self.best_time_difference[0]:
             self.best_time_difference = time_difference
-            
+
         if self.worst_time_difference[1] in ["Faster", "Equal"]:
             if (time_difference[1] == "Slower" and (self.worst_time_difference[1] == "Equal" or time_difference[0] < self.worst_time_difference[0])) or (time_difference[1] == "Equal"):
                 self.worst_time_difference = time_difference
         elif time_difference[0] > self.worst_time_difference[0]:
             self.worst_time_difference = time_difference
-            
+
     def update_test_results(self, test: TestResult):
+        self.no_of_tests += 1
         if test.matching:
-            self.true_list.append(test)
-        else:
+            self.correct_results += 1
+            if len(self.true_list) < self.keep: self.true_list.append(test)
+        elif len(self.false_list) < self.keep:
             self.false_list.append(test)
         self.total_builtin_time += test.builtin_time
         self.total_algorithm_time += test.algorithm_time
-        self._update_time_difference(test)
+        self.builtin_times.add(test.builtin_time)
+        self.algorithm_times.add(test.algorithm_time)
+        self._update_time_difference(test.time_difference)
+
+    def merge(self, other: 'MultiTestResult'):
+        """Add the statistics of another run, such as one from a worker process."""
+        self.true_list.extend(other.true_list[:self.keep - len(self.true_list)])
+        self.false_list.extend(other.false_list[:self.keep - len(self.false_list)])
+        self.no_of_tests += other.no_of_tests
+        self.correct_results += other.correct_results
+        self.total_builtin_time += other.total_builtin_time
+        self.total_algorithm_time += other.total_algorithm_time
+        self.builtin_times.merge(other.builtin_times)
+        self.algorithm_times.merge(other.algorithm_times)
+        self._update_time_difference(other.best_time_difference)
+        self._update_time_difference(other.worst_time_difference)
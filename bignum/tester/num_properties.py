@@ -3,63 +3,122 @@ from typing import Optional
 import random
 import os, sys
 
+import gmpy2
+
 from ..bignum import bignum
 
+# Maps random bytes to ASCII digits. Bytes 250 to 255 are dropped, so that every digit is equally likely.
+_ASCII_DIGITS = bytes(ord('0') + byte % 10 for byte in range(256))
+_UNEVEN_BYTES = bytes(range(250, 256))
+
+
+def _random_digits(generator, length: int) -> bytes:
+    """Draw `length` random ASCII digits in bulk from a `random.Random`-like source."""
+    digits = b''
+    while len(digits) < length:
+        missing = length - len(digits)
+        digits += generator.randbytes(missing + missing // 32 + 16).translate(_ASCII_DIGITS, _UNEVEN_BYTES)
+    return digits[:length]
+
+
+def _random_below(generator, bound: int) -> int:
+    """Draw a random integer in [0, bound), rejecting draws of bound.bit_length() bits that fall outside it."""
+    bits = bound.bit_length()
+    while True:
+        value = generator.getrandbits(bits)
+        if value < bound:
+            return value
+
+
 @dataclass
 class NumProperties:
     min_whole_no_len: Optional[int] = 1
     max_whole_no_len: Optional[int] = 10
-    whole_no_len: Optional[int] = None # Use a specified length. Overrides min_whole_len and max_whole_len if not set to None. 
-    
+    whole_no_len: Optional[int] = None # Use a specified length. Overrides min_whole_len and max_whole_len if not set to None.
+
     # True=Yes, False=No, None=Random
     decimal: Optional[bool] = None
     negative: Optional[bool] = None
-    
+
     min_decimal_len: Optional[int] = 1
     max_decimal_len: Optional[int] = 10
     decimal_len: Optional[int] = None # Use a specified length. Overrides min_whole_len and max_whole_len if not set to None.
-    
+
     # Options for large number generation
-    chunk_size: Optional[int] = 10000
-    max_chunk_variety: Optional[int] = 20
     repeat_whole: Optional[int|str|bignum] = None # Repeats the given value
     repeat_decimal: Optional[int|str|bignum] = None
-    
+
+    # Seeds a private `random.Random`, so the same seed gives the same values on every machine.
+    # When None, values are drawn from the `random` module, so `random.seed` makes runs repeatable.
+    seed: Optional[int] = None
+    # Draw the mantissa as one random integer, without building or parsing a digit string.
+    # The generated value then only has its numeric parts until it is printed.
+    as_parts: Optional[bool] = False
+
+    def __post_init__(self):
+        self._generator = None
+
     def _validate_inputs(self):
         if (self.whole_no_len is not None and self.whole_no_len <= 0) or (self.max_whole_no_len <= 0): raise ValueError("Length of whole number cannot be < 1")
         if (self.decimal_len is not None and self.decimal_len <= 0) or (self.max_decimal_len <= 0): self.decimal = False
         self.min_whole_no_len = max(self.min_whole_no_len, 1)
         self.min_decimal_len = max(self.min_decimal_len, 1)
-        
-    def _generate_whole(self):
-        whole_len = self.whole_no_len if self.whole_no_len is not None else random.randint(self.min_whole_no_len, self.max_whole_no_len)
+
+    def _get_generator(self):
+        if self.seed is None:
+            return random
+        if self._generator is None:
+            self._generator = random.Random(self.seed)
+        return self._generator
+
+    @staticmethod
+    def _random_len(generator, min_len, max_len):
+        return min_len + _random_below(generator, max_len - min_len + 1)
+
+    def _generate_whole(self, generator, whole_len):
         if self.repeat_whole is not None: return (str(self.repeat_whole)*((whole_len//len(str(self.repeat_whole)))+1))[:whole_len]
         if whole_len == 1:
-            return random.randint(0, 9)
-        chunk_size = min(self.chunk_size, whole_len)
-        whole_chunks = [str(random.randint(1, 9)) + ''.join(str(random.randint(0, 9)) for _ in range(chunk_size - 1)) for _ in range(min(whole_len // chunk_size + 1, self.max_chunk_variety))]
-        return ''.join(random.choices(whole_chunks, k=(whole_len + chunk_size - 1) // chunk_size))[:whole_len]
-        
-    def _generate_decimal(self):
-        if (self.decimal is True) or (self.decimal is None and random.choice([True, False]) is True):
-            decimal_len = self.decimal_len if self.decimal_len is not None else random.randint(self.min_decimal_len, self.max_decimal_len)
-            if self.repeat_decimal is not None: 
-                return f'.{(str(self.repeat_decimal) * (decimal_len // len(str(self.repeat_decimal)) + 1))[:decimal_len]}'
-            chunk_size = min(self.chunk_size, decimal_len)
-            decimal_chunks = [''.join(str(random.randint(0, 9)) for _ in range(chunk_size-1)) + str(random.randint(1, 9)) for _ in range(min(decimal_len//self.chunk_size+1, self.max_chunk_variety))]
-            decimal = ''.join(random.choices(decimal_chunks, k=(decimal_len + chunk_size - 1) // chunk_size))[:decimal_len]
-            return f'.{decimal}'
-        return ''
-    
-    def _generate_negative(self):
-        return '-' if \
-            (self.negative is True) or \
-                (self.negative is None and random.choice([True, False]) is True) \
-                    else ''
-    
+            return str(_random_below(generator, 10))
+        return str(1 + _random_below(generator, 9)) + _random_digits(generator, whole_len - 1).decode('ascii')
+
+    def _generate_decimal(self, generator, decimal_len):
+        if not decimal_len:
+            return ''
+        if self.repeat_decimal is not None:
+            return f'.{(str(self.repeat_decimal) * (decimal_len // len(str(self.repeat_decimal)) + 1))[:decimal_len]}'
+        return f'.{_random_digits(generator, decimal_len - 1).decode("ascii")}{1 + _random_below(generator, 9)}'
+
+    def _generate_negative(self, generator):
+        return (self.negative is True) or (self.negative is None and _random_below(generator, 2) == 1)
+
+    def _generate_parts(self, generator, whole_len, decimal_len, negative):
+        """Draw the mantissa directly: uniform over the values with the given digit counts and no trailing decimal zero."""
+        length = whole_len + decimal_len
+        # A single whole digit can be zero; longer whole parts start with a nonzero digit.
+        low = 0 if whole_len == 1 else int(gmpy2.mpz(10) ** (length - 1))
+        mantissa = low + _random_below(generator, int(gmpy2.mpz(10) ** length) - low)
+        if decimal_len and mantissa % 10 == 0:
+            mantissa += 1 + _random_below(generator, 9)
+        return bignum._from_parts(negative and bool(mantissa), mantissa, decimal_len)
+
     def generate(self):
         self._validate_inputs()
-        whole = self._generate_whole()
-        decimal = self._generate_decimal()
-        negative = self._generate_negative()
-        return bignum(f"{negative}{whole}{decimal}").filtered()
+        generator = self._get_generator()
+        whole_len = self.whole_no_len if self.whole_no_len is not None else self._random_len(generator, self.min_whole_no_len, self.max_whole_no_len)
+        decimal_len = 0
+        if (self.decimal is True) or (self.decimal is None and _random_below(generator, 2) == 1):
+            decimal_len = self.decimal_len if self.decimal_len is not None else self._random_len(generator, self.min_decimal_len, self.max_decimal_len)
+        negative = self._generate_negative(generator)
+
+        if self.as_parts and self.repeat_whole is None and self.repeat_decimal is None:
+            return self._generate_parts(generator, whole_len, decimal_len, negative)
+        whole = self._generate_whole(generator, whole_len)
+        decimal = self._generate_decimal(generator, decimal_len)
+        if self.repeat_whole is not None or self.repeat_decimal is not None:
+            return bignum(f"{'-' if negative else ''}{whole}{decimal}").filtered()
+
+        # Random digits have no leading or trailing zeros, so the value is already filtered
+        # and needs no validation. Its parts are parsed here, outside of any timed operation.
+        num = bignum._from_trusted(f"{'-' if negative and (whole != '0' or decimal) else ''}{whole}{decimal}")
+        num._parts()
+        return num
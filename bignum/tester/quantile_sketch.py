@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Optional
+import math
+
+class QuantileSketch:
+    """
+    A streaming summary of non-negative integers, such as timings in nanoseconds, that answers
+    quantile queries in bounded memory.
+
+    Values are counted in buckets whose bounds grow by a factor gamma = (1 + a) / (1 - a), after
+    the DDSketch of Masson, Rim and Lee (2019): every quantile is returned within a relative error
+    of a = `relative_accuracy`, the number of buckets grows with log(max / min) instead of with the
+    number of values, and two sketches merge exactly by adding their counts. The count, total,
+    minimum and maximum are kept exactly.
+
+    Examples:
+        >>> sketch = QuantileSketch()
+        >>> for value in range(1, 1001):
+        ...     sketch.add(value)
+        >>> sketch.count, sketch.total, abs(sketch.quantile(0.5) - 500) <= 10, abs(sketch.quantile(0.95) - 950) <= 19
+        (1000, 500500, True, True)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, value: int):
+        if value < 0:
+            raise ValueError("Quantile sketches only hold non-negative values")
+        if value == 0:
+            self.zeros += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: QuantileSketch):
+        """Add the values counted by another sketch of the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Return the q-quantile (0 <= q <= 1) of the values, or None if there are none."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # The bucket holds values in (gamma**(index - 1), gamma**index]; this point is within the relative accuracy of all of them.
+                estimate = round(2 * self._gamma**index / (self._gamma + 1))
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def median(self) -> Optional[int]:
+        return self.quantile(0.5)
+
+    @property
+    def p95(self) -> Optional[int]:
+        return self.quantile(0.95)
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 
 from bignum.bignum import bignum
+from .time_task import format_ns
 
 @dataclass
 class TestResult:
@@ -9,11 +10,11 @@ class TestResult:
     input_values: list[int | str | bignum]
     
     algorithm_result: bignum
-    algorithm_time: Decimal|float
+    algorithm_time: int # Nanoseconds
     
     builtin_result: int | float | Decimal
     # builtin_result_type: type
-    builtin_time: Decimal|float
+    builtin_time: int # Nanoseconds
     
     matching: bool
     
@@ -38,10 +39,10 @@ class TestResult:
             if not include_input_values: result.append(self.algorithm_result)
             result.append(self.builtin_result)
         if include_matching: result.append(self.matching)
-        if include_algorithm_time: result.append(f"{bignum(self.algorithm_time).truncate_decimal_to_significant_digit(4)}s")
-        if include_builtin_time: result.append(f"{bignum(self.builtin_time).truncate_decimal_to_significant_digit(4)}s")
+        if include_algorithm_time: result.append(format_ns(self.algorithm_time))
+        if include_builtin_time: result.append(format_ns(self.builtin_time))
         if include_speed_difference:
-            if self.builtin_time > self.algorithm_time: result.append(f"{round(float(self.builtin_time/self.algorithm_time), 2)}x faster")
-            else: result.append(f"{round(float(self.algorithm_time/self.builtin_time), 2)}x slower")
+            if self.builtin_time > self.algorithm_time: result.append(f"{round(self.builtin_time/self.algorithm_time, 2)}x faster")
+            else: result.append(f"{round(self.algorithm_time/self.builtin_time, 2)}x slower")
         result = " | ".join((str(item) for item in result))
         return result
@@ -1,16 +1,41 @@
 import random
 import os, sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 from dataclasses import dataclass, field
 from typing import Optional
 
-from .time_task import time_task
+from .time_task import time_task, format_ns
 from .test_result import TestResult
 from .multi_test_result import MultiTestResult
 from .input_values import InputValues
 from .num_properties import NumProperties
-    
+from .benchmark import BenchmarkReport, BenchmarkResult, DEFAULT_SIZES, DEFAULT_THRESHOLD
+from .. import stream
+
+LARGE_VALUES_PATH = os.path.join(os.path.expanduser('~'), '.large_values.txt')
+
+
+def _run_batch(tester, input_values, no_of_tests, seed=None, print_matching=None):
+    """
+    Run `no_of_tests` random tests, seeding the generator with `seed` if given, and collect them 
+    into a MultiTestResult. Tests whose `matching` equals `print_matching` are printed as they finish.
+    Module-level so that worker processes can run it; the tester and input values are pickled over.
+    """
+    state = random.getstate()
+    if seed is not None: random.seed(seed)
+    test_results = MultiTestResult()
+    try:
+        for _ in range(no_of_tests):
+            res = tester.test_normal(*input_values.generate(), print_result=False)
+            if res.matching == print_matching:
+                print(res.as_str(), flush=True)
+            test_results.append_test(res)
+    finally:
+        if seed is not None: random.setstate(state)
+    return test_results
+
 
 class Tester:
     def __init__(self, operation: str, operation_func):
@@ -90,17 +115,21 @@ class Tester:
                 for test in test_results.true_list:
                     print(test.as_str())
                 if test_results.correct_results:
-                    print(f"Correct Results: {test_results.correct_results}\n")
+                    print(f"Correct Results: {test_results.correct_results}{self.__shown(test_results.true_list, test_results.correct_results)}\n")
             for test in test_results.false_list:
                 print(test.as_str())
             if test_results.incorrect_results:
-                print(f"Incorrect Results: {test_results.incorrect_results}\n")
+                print(f"Incorrect Results: {test_results.incorrect_results}{self.__shown(test_results.false_list, test_results.incorrect_results)}\n")
+    
+    @staticmethod
+    def __shown(kept, total):
+        return f" (first {len(kept)} shown)" if len(kept) < total else ""
                 
     def __print_stats(self, test_results: MultiTestResult):
-        print("Average Built-In Time for 1 Operation: {}s".format(test_results.average_builtin_time))
-        print("Total Time Taken by Built-In Calculation: {}s\n".format(test_results.total_builtin_time))
-        print("Average Algorithm Time for 1 Operation: {}s (Best: {}x {}) (Worst: {}x {})".format(test_results.average_algorithm_time, test_results.best_time_difference[0], test_results.best_time_difference[1], test_results.worst_time_difference[0], test_results.worst_time_difference[1]))
-        print("Total Time Taken by Algorithm: {}s ({}x {})".format(test_results.total_algorithm_time, test_results.time_difference[0], test_results.time_difference[1]))
+        print("Average Built-In Time for 1 Operation: {} (Median: {}) (p95: {})".format(format_ns(test_results.average_builtin_time), format_ns(test_results.builtin_times.median), format_ns(test_results.builtin_times.p95)))
+        print("Total Time Taken by Built-In Calculation: {}\n".format(format_ns(test_results.total_builtin_time)))
+        print("Average Algorithm Time for 1 Operation: {} (Median: {}) (p95: {}) (Best: {}x {}) (Worst: {}x {})".format(format_ns(test_results.average_algorithm_time), format_ns(test_results.algorithm_times.median), format_ns(test_results.algorithm_times.p95), test_results.best_time_difference[0], test_results.best_time_difference[1], test_results.worst_time_difference[0], test_results.worst_time_difference[1]))
+        print("Total Time Taken by Algorithm: {} ({}x {})".format(format_ns(test_results.total_algorithm_time), test_results.time_difference[0], test_results.time_difference[1]))
         print("Total tests: {}".format(test_results.no_of_tests))
         print("Correct results: {}".format(test_results.correct_results))
         print("Incorrect results: {}".format(test_results.incorrect_results))
@@ -110,27 +139,118 @@ class Tester:
                     no_of_tests=50, 
                     only_false=False, 
                     immediate_print=False, 
-                    input_values: InputValues = None):
-
+                    input_values: InputValues = None,
+                    workers=None,
+                    seed=None):
+        """
+        Run random tests and print the results and statistics.
+        
+        Args:
+            workers (int): Spread the tests over this many processes (default: None, run them here). 
+            Each process generates its inputs, runs both calculations and compares them, and 
+            times each calculation itself, so the timings are not skewed by the other processes. 
+            The operation function must be picklable, e.g. a module-level function or a bound 
+            method of an engine, not a lambda.
+            seed: Seed for the input generation (default: None, unseeded). Worker i is seeded with 
+            f"{seed}:{i}", so a seeded run generates the same tests every time.
+            
+        Returns:
+            MultiTestResult: The merged statistics of all the workers.
+        """
         if not input_values: input_values = InputValues()
         test_results = MultiTestResult()
-
-        for _ in range(no_of_tests):
-            res = self.test_normal(*input_values.generate(), print_result=False)
-            if immediate_print and (res.matching != only_false):
-                print(res.as_str())
-            test_results.append_test(res)
+        print_matching = (not only_false) if immediate_print else None
+        
+        if workers is None or workers <= 1:
+            test_results.merge(_run_batch(self, input_values, no_of_tests, seed, print_matching))
+        else:
+            if seed is None: seed = random.getrandbits(64)
+            counts = [no_of_tests // workers + (i < no_of_tests % workers) for i in range(workers)]
+            seeds = [f"{seed}:{i}" for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for batch in executor.map(_run_batch, [self] * workers, [input_values] * workers, counts, seeds, [print_matching] * workers):
+                    test_results.merge(batch)
             
         if not immediate_print:
             self.__print_results(test_results, only_false)
         self.__print_stats(test_results)
+        return test_results
+        
+    def benchmark_inputs(self, digits: int, seed=0, decimal=False, negative=False):
+        """
+        Generate the two operands of a benchmark with `digits` digits each, the same for every run with the same seed.
+        Divisors get half the digits, so that quotients are as long as divisors.
+        With `decimal`, half of the digits of each operand are decimal places.
+        """
+        def properties(length):
+            if decimal and length > 1:
+                return NumProperties(whole_no_len=length - length // 2, decimal=True, decimal_len=length // 2, negative=negative, as_parts=True)
+            return NumProperties(whole_no_len=length, decimal=False, negative=negative, as_parts=True)
+        
+        state = random.getstate()
+        random.seed(f"{seed}:{self.operation}:{digits}")
+        try:
+            num1 = properties(digits).generate()
+            num2 = properties(max(digits // 2, 1) if self.operation == '/' else digits).generate()
+        finally:
+            random.setstate(state)
+        return num1, num2
+    
+    def benchmark(self,
+                  sizes=DEFAULT_SIZES,
+                  repetitions=5,
+                  warmup=1,
+                  seed=0,
+                  decimal=False,
+                  negative=False,
+                  baseline=None,
+                  threshold=DEFAULT_THRESHOLD,
+                  print_results=True) -> BenchmarkReport:
+        """
+        Time the operation on seeded operands of every size in `sizes` (in digits).
+        
+        Each size gets `warmup` untimed calls, then `repetitions` timed ones. Results memoised by 
+        an engine cache would be timed as lookups, so keep `Multiply.cache` and `Divide.cache` unset.
+        
+        Args:
+            baseline: A BenchmarkReport, or the path of one saved with `BenchmarkReport.to_json`, to
+            compare against. Sizes whose median is more than `threshold` slower are reported as regressions.
+            
+        Returns:
+            BenchmarkReport: The timings; see `to_json`, `to_csv` and `compare`.
+        """
+        report = BenchmarkReport(seed=seed, warmup=warmup, repetitions=repetitions)
+        for digits in sizes:
+            num1, num2 = self.benchmark_inputs(digits, seed, decimal, negative)
+            for _ in range(warmup):
+                self.operation_func(num1, num2)
+            times = [time_task(lambda: self.operation_func(num1, num2))[1] / 1e9 for _ in range(repetitions)]
+            result = BenchmarkResult(self.operation, digits, times)
+            report.results.append(result)
+            if print_results: print(result.as_str())
         
-    def generate_large_file(self, num1_properties=None, num2_properties=None):
+        if baseline is not None:
+            if not isinstance(baseline, BenchmarkReport): baseline = BenchmarkReport.from_json(baseline)
+            regressions = report.compare(baseline, threshold)
+            if print_results:
+                for regression in regressions:
+                    print(f"Regression: {regression.as_str()}")
+                print(f"Regressions: {len(regressions)}")
+        return report
+    
+    def generate_large_file(self, num1_properties=None, num2_properties=None, path=LARGE_VALUES_PATH):
         if num1_properties is None: num1_properties = NumProperties(whole_no_len=100000, decimal=False, negative=False)
         if num2_properties is None: num2_properties = NumProperties(whole_no_len=100000, decimal=False, negative=False)
-        with open(f"{os.path.expanduser('~')}\\.large_values.txt", 'w') as f:
+        with open(path, 'wb') as f:
             num1 = num1_properties.generate()
             num2 = num2_properties.generate()
-            f.write(f"{num1}\n{num2}\n\n\n")
+            num1.to_file(f)
+            f.write(b"\n")
+            num2.to_file(f)
+            f.write(b"\n\n\n")
         return num1, num2
+    
+    def load_large_file(self, path=LARGE_VALUES_PATH):
+        """Read back the values written by `generate_large_file`, parsing the digits straight from the memory-mapped file."""
+        return tuple(stream.iter_numbers(path))
     
\ No newline at end of file
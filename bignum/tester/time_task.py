@@ -1,18 +1,57 @@
 import time
-from decimal import Decimal
+from functools import wraps
 
-def time_task(func):
-    start = time.perf_counter()
+from ..bignum import bignum
+
+# Calls faster than this, in nanoseconds, are timed again in a loop that lasts at least this long.
+MIN_TIME_NS = 20_000
+
+def _autorange(func, min_time_ns: int) -> int:
+    """
+    Time `func` in loops of 1, 2, 5, 10, 20, 50, ... calls, as `timeit.Timer.autorange` does,
+    until a loop lasts `min_time_ns`, and return the average time of one call in nanoseconds.
+    """
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = multiplier * scale
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                func()
+            elapsed = time.perf_counter_ns() - start
+            if elapsed >= min_time_ns:
+                return elapsed // number
+        scale *= 10
+
+def time_task(func, min_time_ns: int = MIN_TIME_NS):
+    """
+    Call `func` and time it with `time.perf_counter_ns`.
+
+    Calls shorter than `min_time_ns` are too close to the clock's resolution and overhead to be
+    measured once, so they are repeated (see `_autorange`); `func` must then be free of side effects.
+
+    Returns:
+        The result of the first call, and the time of one call in integer nanoseconds.
+    """
+    start = time.perf_counter_ns()
     res = func()
-    end = time.perf_counter()
-    time_taken = Decimal(end)-Decimal(start)
+    time_taken = time.perf_counter_ns() - start
+    if time_taken < min_time_ns:
+        time_taken = _autorange(func, min_time_ns)
     return res, time_taken
 
 def time_task_wrapper(func):
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.perf_counter()
-        res = func(*args, **kwargs)
-        end = time.perf_counter()
-        time_taken = Decimal(end)-Decimal(start)
-        return res, time_taken
-    return wrapper
\ No newline at end of file
+        return time_task(lambda: func(*args, **kwargs))
+    return wrapper
+
+def format_ns(ns: int, digits: int = 4) -> str:
+    """
+    Format integer nanoseconds as seconds, truncated to `digits` significant digits.
+
+    Examples:
+        >>> format_ns(1234567), format_ns(12)
+        ('0.001234s', '0.000000012s')
+    """
+    return f"{bignum._from_parts(False, ns, 9).filtered().truncate_decimal_to_significant_digit(digits)}s"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import Tuple
+import struct
+
+from .bignum import bignum
+
+# Version 1 layout, all fields little-endian:
+#   magic b'BN' | version (u8) | flags (u8) | 4 padding bytes | scale (i64) | limb count (u64) | limbs
+# The limbs are the mantissa in 64-bit words, least significant first. The header is 24 bytes,
+# so the limbs start 8-byte aligned and a memoryview of them can be cast to 'Q'.
+FORMAT_VERSION = 1
+LIMB_BYTES = 8
+
+_MAGIC = b'BN'
+_HEADER = struct.Struct('<2sBB4xqQ')
+_NEGATIVE = 0x01
+
+
+def encode(negative: bool, mantissa: int, scale: int) -> bytes:
+    """
+    Pack the numeric parts of a value into the binary wire format.
+
+    Examples:
+        >>> encode(True, 125, 1).hex(' ', -8)
+        '424e010100000000 0100000000000000 0100000000000000 7d00000000000000'
+    """
+    limbs = (mantissa.bit_length() + 8 * LIMB_BYTES - 1) // (8 * LIMB_BYTES)
+    try:
+        header = _HEADER.pack(_MAGIC, FORMAT_VERSION, _NEGATIVE if negative else 0, scale, limbs)
+    except struct.error:
+        raise OverflowError(f"Scale {scale} does not fit in the binary format") from None
+    return header + mantissa.to_bytes(limbs * LIMB_BYTES, 'little')
+
+
+def decode_parts(buffer) -> Tuple[bool, int, int]:
+    """
+    Unpack the numeric parts of a value from any bytes-like object, without copying the limbs.
+
+    Returns:
+        Tuple[bool, int, int]: The sign (True if negative), the mantissa and the scale.
+    """
+    view = memoryview(buffer).cast('B')
+    if len(view) < _HEADER.size:
+        raise ValueError("Invalid value: buffer is shorter than the binary header")
+    magic, version, flags, scale, limbs = _HEADER.unpack_from(view)
+    if magic != _MAGIC:
+        raise ValueError("Invalid value: buffer does not hold a binary bignum")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format version: {version}")
+    end = _HEADER.size + limbs * LIMB_BYTES
+    if end != len(view):
+        raise ValueError(f"Invalid value: expected {end} bytes, got {len(view)}")
+    return bool(flags & _NEGATIVE), int.from_bytes(view[_HEADER.size:end], 'little'), scale
+
+
+def decode(buffer) -> bignum:
+    """
+    Build a bignum from the binary wire format.
+
+    Examples:
+        >>> decode(encode(True, 125, 1))
+        bignum('-12.5')
+    """
+    num = bignum._from_parts(*decode_parts(buffer))
+    if type(buffer) is bytes:
+        # Immutable, so it can serve as the value's own encoding.
+        num._bytes = buffer
+    return num